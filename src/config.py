@@ -156,6 +156,8 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
 # Transcription settings
 TRANSCRIPTION_MODELS = ["tiny", "base", "small", "medium", "large"]
 DEFAULT_TRANSCRIPTION_TIMEOUT = 1800  # 30 minutes max for transcription
+TRANSCRIPTION_BACKEND = "whisper"  # "whisper" or "faster-whisper" (int8 inference, used when installed)
+TRANSCRIPTION_TORCH_COMPILE = False  # Compile the Whisper encoder with torch.compile on CUDA (slow first job)
 
 # Translation settings
 TRANSLATION_LANGUAGES = {
@@ -172,6 +174,8 @@ TRANSLATION_LANGUAGES = {
     "zh": "Chinese",
 }
 DEFAULT_TRANSLATION_TIMEOUT = 300  # 5 minutes max for translation
+TRANSLATION_PACK_SIZE = 20  # Segments joined into one text for engines that translate a single text per call
+TRANSLATION_CACHE_TTL_DAYS = 30  # Days translated texts are kept in the on-disk translation cache
 
 def load_settings() -> Dict[str, Any]:
     """"
@@ -279,6 +279,10 @@ class ApplicationManager(QObject):
         save_settings(self.settings)
         logger.info("Settings saved")
         
+        # Flush pending error log records
+        if hasattr(self, 'error_reporter'):
+            self.error_reporter.close()
+        
         logger.info("Application shutdown complete")
     
     # Batch processing methods
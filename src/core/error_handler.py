@@ -3,13 +3,19 @@ Error handling module for YouTube Translator Pro.
 Provides error reporting, logging, and crash handling functionality.
 """"
 
+import io
 import os
 import sys
 import traceback
 import logging
+import logging.handlers
 import json
+import queue
 import platform
+import shutil
 import threading
+import time
+from collections import deque
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from enum import Enum, auto
@@ -31,6 +37,41 @@ except ImportError:
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Error log rotation threshold in bytes and number of rotated backups kept
+MAX_ERROR_LOG_SIZE = 1_048_576
+ERROR_LOG_BACKUP_COUNT = 3
+
+# Error reports allowed per second (and burst size) before reports are dropped
+ERROR_RATE_LIMIT = 100
+
+# Per-thread cache of the current thread name
+_tls = threading.local()
+
+
+def _current_thread_name() -> str:
+    """Return the current thread name, cached per thread."""
+    name = getattr(_tls, "name", None)
+    if name is None:
+        name = _tls.name = threading.current_thread().name
+    return name
+
+
+def _atomic_write(file_path: str, data: bytes) -> None:
+    """"
+    Write data to a file atomically.
+    
+    The data is written in one call to a temporary sibling file which then
+    replaces the target, so readers never observe a partially written file.
+    
+    Args:
+        file_path: Destination file path
+        data: Bytes to write
+    """"
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
 class ErrorSeverity(Enum):
     """Enum representing error severity levels."""
     INFO = auto()
@@ -38,6 +79,17 @@ class ErrorSeverity(Enum):
     ERROR = auto()
     CRITICAL = auto()
 
+# Python logging level for each error severity
+_SEVERITY_LOG_LEVELS = {
+    ErrorSeverity.INFO: logging.INFO,
+    ErrorSeverity.WARNING: logging.WARNING,
+    ErrorSeverity.ERROR: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+# Precomputed severity names
+_SEVERITY_NAMES = {severity: severity.name for severity in ErrorSeverity}
+
 class ErrorReporter(QObject):
     """"
     Handles reporting and logging of application errors.
@@ -65,10 +117,61 @@ class ErrorReporter(QObject):
         os.makedirs(log_dir, exist_ok=True)
         
         self.log_dir = log_dir
-        self.error_log_file = os.path.join(log_dir, "errors.json")
+        self.error_log_file = os.path.join(log_dir, "errors.jsonl")
+        
+        # Earlier versions kept the whole log as one JSON array in errors.json
+        self._import_legacy_error_log(os.path.join(log_dir, "errors.json"))
+        
+        # Persist errors as JSON lines through a rotating file handler. The
+        # queue listener performs the file I/O on a background thread.
+        self._file_handler = logging.handlers.RotatingFileHandler(
+            self.error_log_file, maxBytes=MAX_ERROR_LOG_SIZE,
+            backupCount=ERROR_LOG_BACKUP_COUNT, encoding='utf-8', delay=True
+        )
+        self._log_queue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        self._log_listener = logging.handlers.QueueListener(self._log_queue, self._file_handler)
+        self._log_listener.start()
+        
+        # Token bucket protecting disk and UI from error bursts
+        self._rate_lock = threading.Lock()
+        self._tokens = float(ERROR_RATE_LIMIT)
+        self._last_refill = time.monotonic()
+        self._dropped_errors = 0
         
         logger.info(f"Error reporter initialized with log directory {log_dir}")
     
+    def _import_legacy_error_log(self, legacy_file: str) -> None:
+        """"
+        Move errors from a legacy JSON array log into the JSON lines log.
+        
+        The legacy errors are placed before any errors already in the JSON
+        lines log, and the legacy file is deleted once they are written.
+        
+        Args:
+            legacy_file: Path of the legacy errors.json
+        """"
+        if not os.path.exists(legacy_file):
+            return
+            
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                errors = json.load(f)
+            
+            temp_file = self.error_log_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as out:
+                for error in errors:
+                    out.write(json.dumps(error, separators=(',', ':')) + '\n')
+                if os.path.exists(self.error_log_file):
+                    with open(self.error_log_file, 'r', encoding='utf-8') as f:
+                        shutil.copyfileobj(f, out)
+            os.replace(temp_file, self.error_log_file)
+            os.remove(legacy_file)
+            
+            logger.info(f"Imported {len(errors)} errors from {legacy_file}")
+        except Exception as e:
+            logger.error(f"Failed to import legacy error log: {e}")
+    
     def report_error(self, message: str, details: str = "", )
                      severity: ErrorSeverity = ErrorSeverity.ERROR,
                      log_to_file: bool = True) -> Dict[str, Any]:
@@ -89,58 +192,78 @@ class ErrorReporter(QObject):
             "timestamp": datetime.now().isoformat(),
             "message": message,
             "details": details,
-            "severity": severity.name,
-            "thread": threading.current_thread().name
+            "severity": _SEVERITY_NAMES[severity],
+            "thread": _current_thread_name()
         }
         
-        # Log to Python logger
-        if severity == ErrorSeverity.INFO:
-            logger.info(f"{message} - {details}")
-        elif severity == ErrorSeverity.WARNING:
-            logger.warning(f"{message} - {details}")
-        elif severity == ErrorSeverity.ERROR:
-            logger.error(f"{message} - {details}")
-        elif severity == ErrorSeverity.CRITICAL:
-            logger.critical(f"{message} - {details}")
+        # Drop the report if the rate limit is exhausted
+        if not self._acquire_token():
+            return error_info
+        
+        # Log to Python logger, skipping formatting when the level is disabled
+        level = _SEVERITY_LOG_LEVELS.get(severity)
+        if level is not None and logger.isEnabledFor(level):
+            logger.log(level, f"{message} - {details}")
         
         # Log to file if requested
         if log_to_file:
-            self._log_error_to_file(error_info)
+            self._queue_handler.handle(logging.makeLogRecord({
+                "name": __name__,
+                "levelno": level or logging.ERROR,
+                "levelname": error_info["severity"],
+                "msg": json.dumps(error_info, separators=(',', ':')),
+            }))
         
-        # Emit signal
-        self.error_reported.emit(message, details, severity)
+        # Emit signal only when something is listening
+        if self.receivers(self.error_reported) > 0:
+            self.error_reported.emit(message, details, severity)
         
         return error_info
     
-    def _log_error_to_file(self, error_info: Dict[str, Any]) -> None:
+    def _acquire_token(self) -> bool:
         """"
-        Log error information to file.
+        Take a token from the rate-limit bucket.
         
-        Args:
-            error_info: Dictionary with error information
+        Returns:
+            True if the error may be reported, False if it should be dropped
         """"
-        try:
-                # Load existing errors
-            errors = []
-            if os.path.exists(self.error_log_file):
-                try:
-                        with open(self.error_log_file, 'r', encoding='utf-8') as f:
-                        errors = json.load(f)
-                except Exception as e:
-                    logger.error(f"Failed to load error log file: {e}")
-            
-            # Add new error
-            errors.append(error_info)
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(float(ERROR_RATE_LIMIT),
+                               self._tokens + (now - self._last_refill) * ERROR_RATE_LIMIT)
+            self._last_refill = now
             
-            # Keep only last 100 errors
-            if len(errors) > 100:
-                errors = errors[-100:]
+            if self._tokens < 1:
+                self._dropped_errors += 1
+                return False
                 
-            # Save to file
-            with open(self.error_log_file, 'w', encoding='utf-8') as f:
-                json.dump(errors, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to log error to file: {e}")
+            self._tokens -= 1
+            dropped, self._dropped_errors = self._dropped_errors, 0
+        
+        if dropped:
+            logger.warning(f"Dropped {dropped} error reports due to rate limiting")
+        return True
+    
+    def _read_error_lines(self, file_path: str, errors: deque) -> None:
+        """"
+        Read JSON lines from an error log file into a bounded deque.
+        
+        Args:
+            file_path: Path of the error log file
+            errors: Deque receiving the parsed errors
+        """"
+        if not os.path.exists(file_path):
+            return
+            
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    errors.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping malformed line in {file_path}")
     
     def get_error_log(self, max_errors: int = 100) -> List[Dict[str, Any]]:
         """"
@@ -152,19 +275,35 @@ class ErrorReporter(QObject):
         Returns:
             List of dictionaries with error information
         """"
-        if not os.path.exists(self.error_log_file):
-            return []
-            
+        errors = deque(maxlen=max_errors)
+        
         try:
-                with open(self.error_log_file, 'r', encoding='utf-8') as f:
-                errors = json.load(f)
-                
-            # Return the last max_errors
-            return errors[-max_errors:]
+            # Read rotated backups oldest first, then the current file
+            for file_path in self._error_log_files()[::-1]:
+                self._read_error_lines(file_path, errors)
+            return list(errors)
         except Exception as e:
             logger.error(f"Failed to get error log: {e}")
             return []
     
+    def _error_log_files(self) -> List[str]:
+        """"
+        Get the error log file paths, newest first.
+        
+        Returns:
+            List with the current log file followed by its rotated backups
+        """"
+        return [self.error_log_file] + [
+            f"{self.error_log_file}.{i}" for i in range(1, ERROR_LOG_BACKUP_COUNT + 1)
+        ]
+    
+    def close(self) -> None:
+        """"
+        Flush pending error records and release the error log file.
+        """"
+        self._log_listener.stop()
+        self._file_handler.close()
+    
     def clear_error_log(self) -> bool:
         """"
         Clear the error log.
@@ -172,11 +311,18 @@ class ErrorReporter(QObject):
         Returns:
             True if the error log was cleared successfully, False otherwise
         """"
-        if not os.path.exists(self.error_log_file):
-            return True
-            
         try:
-                os.remove(self.error_log_file)
+            # Close the handler's stream so it reopens a fresh file on next write
+            self._file_handler.acquire()
+            try:
+                if self._file_handler.stream:
+                    self._file_handler.stream.close()
+                    self._file_handler.stream = None
+                for file_path in self._error_log_files():
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+            finally:
+                self._file_handler.release()
             logger.info("Error log cleared")
             return True
         except Exception as e:
@@ -214,8 +360,28 @@ class CrashHandler(QObject):
         
         self.crash_dir = crash_dir
         
+        # Remove crash directories left behind when a previous clear was cut short
+        self._start_trash_cleanup()
+        
         logger.info(f"Crash handler initialized with crash directory {crash_dir}")
     
+    def _remove_trash_dirs(self) -> None:
+        """Delete every crash directory that was moved aside for deletion."""
+        parent_dir = os.path.dirname(self.crash_dir) or '.'
+        prefix = os.path.basename(self.crash_dir) + ".to_delete."
+        try:
+            with os.scandir(parent_dir) as it:
+                trash_dirs = [entry.path for entry in it
+                              if entry.name.startswith(prefix) and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for trash_dir in trash_dirs:
+            shutil.rmtree(trash_dir, ignore_errors=True)
+    
+    def _start_trash_cleanup(self) -> None:
+        """Delete moved-aside crash directories off the calling thread."""
+        threading.Thread(target=self._remove_trash_dirs, daemon=True).start()
+    
     def handle_exception(self, exc_type, exc_value, exc_traceback) -> None:
         """"
         Handle uncaught exception.
@@ -234,7 +400,9 @@ class CrashHandler(QObject):
         logger.critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
         
         # Get exception details
-        tb_str = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        tb_buffer = io.StringIO()
+        traceback.print_exception(exc_type, exc_value, exc_traceback, file=tb_buffer)
+        tb_str = tb_buffer.getvalue()
         
         # Create crash report
         crash_report = {
@@ -266,13 +434,12 @@ class CrashHandler(QObject):
             crash_report: Dictionary with crash information
         """"
         try:
-                # Generate crash report filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Generate crash report filename (microseconds keep names unique and sortable)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             crash_file = os.path.join(self.crash_dir, f"crash_{timestamp}.json")
             
             # Save to file
-            with open(crash_file, 'w', encoding='utf-8') as f:
-                json.dump(crash_report, f, indent=2)
+            _atomic_write(crash_file, json.dumps(crash_report, indent=2).encode('utf-8'))
                 
             logger.info(f"Crash report saved to {crash_file}")
         except Exception as e:
@@ -291,20 +458,20 @@ class CrashHandler(QObject):
         reports = []
         
         try:
-                # Get crash files
-            crash_files = [os.path.join(self.crash_dir, f) for f in os.listdir(self.crash_dir) 
-                          if f.startswith("crash_") and f.endswith(".json")]
-            
-            # Sort by modification time (newest first)
-            crash_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            
-            # Limit to max_reports
-            crash_files = crash_files[:max_reports]
+            # Get crash files, newest first. Filenames embed a sortable timestamp,
+            # so ordering by name avoids a stat call per file.
+            entries = sorted(
+                (e for e in os.scandir(self.crash_dir)
+                 if e.name.startswith("crash_") and e.name.endswith(".json")),
+                key=lambda e: e.name,
+                reverse=True
+            )[:max_reports]
             
             # Load crash reports
-            for file_path in crash_files:
+            for entry in entries:
+                file_path = entry.path
                 try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
+                    with open(file_path, 'r', encoding='utf-8') as f:
                         report = json.load(f)
                         reports.append(report)
                 except Exception as e:
@@ -322,18 +489,16 @@ class CrashHandler(QObject):
             True if crash reports were cleared successfully, False otherwise
         """"
         try:
-                # Get crash files
-            crash_files = [os.path.join(self.crash_dir, f) for f in os.listdir(self.crash_dir) 
-                          if f.startswith("crash_") and f.endswith(".json")]
+            # The crash directory is owned by this handler, so move it aside in
+            # one rename and delete the old tree off the calling thread. The
+            # cleanup also picks up trees an earlier run didn't finish deleting.
+            trash_dir = f"{self.crash_dir}.to_delete.{time.time_ns()}"
+            os.rename(self.crash_dir, trash_dir)
+            os.makedirs(self.crash_dir, exist_ok=True)
             
-            # Delete each file
-            for file_path in crash_files:
-                try:
-                        os.remove(file_path)
-                except Exception as e:
-                    logger.error(f"Failed to delete crash report {file_path}: {e}")
+            self._start_trash_cleanup()
                     
-            logger.info(f"Cleared {len(crash_files)} crash reports")
+            logger.info("Cleared crash reports")
             return True
         except Exception as e:
             logger.error(f"Failed to clear crash reports: {e}")
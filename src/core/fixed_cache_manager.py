@@ -7,22 +7,166 @@ import os
 import json
 import time
 import logging
+import functools
 import shutil
+import heapq
+import mmap
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-import hashlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     try:
-    from PyQt6.QtCore import QObject, pyqtSignal
+    from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Delay before pending access log changes are written to disk
+ACCESS_LOG_FLUSH_INTERVAL_MS = 5000
+
+# Schema of the persistent access log
+ACCESS_LOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    atime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE INDEX IF NOT EXISTS items_type_atime ON items (type, atime);
+"""
+
+# Routine maintenance runs after this many writes or written bytes,
+# or immediately once the cache exceeds its maximum size
+MAINTENANCE_WRITE_INTERVAL = 100
+MAINTENANCE_BYTE_INTERVAL = 50 * 1024 * 1024
+
+# Blobs at least this large are written (and JSON files read) through a memory map
+MMAP_WRITE_THRESHOLD = 1024 * 1024
+
+
+def _write_blob(file_path: str, data: bytes) -> None:
+    """"
+    Write binary data to a file.
+    
+    Large blobs are copied straight into a memory-mapped view of the file,
+    skipping the intermediate write buffer.
+    
+    Args:
+        file_path: Destination file path
+        data: Bytes to write
+    """"
+    if len(data) < MMAP_WRITE_THRESHOLD:
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        return
+    
+    # The map needs a read/write handle on all platforms
+    with open(file_path, 'w+b') as f:
+        os.ftruncate(f.fileno(), len(data))
+        with mmap.mmap(f.fileno(), len(data)) as mm:
+            mm[:] = data
+
+# Path separators replaced in model names used in cache file names
+_MODEL_NAME_TRANS = str.maketrans({"/": "-", "\\": "-"})
+
+
+@functools.lru_cache(maxsize=2048)
+def _transcription_file_name(video_id: str, model: str) -> str:
+    """"
+    Build the cache file name of a transcription.
+    
+    Args:
+        video_id: YouTube video ID
+        model: Transcription model used
+        
+    Returns:
+        File name with path separators in the model name replaced
+    """"
+    return f"{video_id}_{model.translate(_MODEL_NAME_TRANS)}.json"
+
+
+@dataclass
+class CacheEntry:
+    """Access log entry of a cached item."""
+    __slots__ = ("atime", "size")
+    
+    atime: float  # Last access time
+    size: int     # Size in bytes
+
+
+def _remove_path(file_path: str) -> bool:
+    """"
+    Remove a cached file, falling back to removing a directory tree.
+    
+    Cache entries are plain files, so unlinking is attempted first rather
+    than checking the file type beforehand.
+    
+    Args:
+        file_path: Path to remove
+        
+    Returns:
+        True if something was removed, False if the path did not exist
+    """"
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return False
+    except IsADirectoryError:
+        shutil.rmtree(file_path)
+    return True
+
+
+def _dump_json(data: Any) -> bytes:
+    """"
+    Serialize cached JSON data to UTF-8 bytes, using orjson when available.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        Indented JSON document as bytes
+    """"
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _load_json(file_path: str) -> Any:
+    """"
+    Load a cached JSON file, using orjson when available.
+    
+    Args:
+        file_path: Path of the JSON file
+        
+    Returns:
+        Parsed JSON data
+    """"
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_WRITE_THRESHOLD:
+                return orjson.loads(f.read())
+            
+            # Parse large files straight from a memory map, skipping the read() copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 class CacheManager(QObject):
     """Cache manager for YouTube Translator Pro."""
     
@@ -68,55 +212,276 @@ class CacheManager(QObject):
         self.max_size_mb = max_size_mb
         self.ttl_seconds = ttl_seconds
         
-        # Initialize access tracking
-        self.access_log_file = os.path.join(cache_dir, "access_log.json")
+        # Initialize access tracking. The access log is persisted in SQLite
+        # so changes are written per item instead of rewriting the whole log.
+        self.access_log_file = os.path.join(cache_dir, "access_log.db")
+        self._db = sqlite3.connect(self.access_log_file)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(ACCESS_LOG_SCHEMA)
         self.access_log = self._load_access_log()
         
+        # Writes since the last maintenance pass
+        self._writes_since_maintenance = 0
+        self._bytes_since_maintenance = 0
+        
+        # Item IDs known to be missing, so repeated misses skip the filesystem
+        self._missing_items = {cache_type: set() for cache_type in self.access_log}
+        
+        # The in-memory access log is authoritative; changed and removed items
+        # are flushed to disk after a short delay instead of on every access
+        self._dirty_items = set()
+        self._deleted_items = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(ACCESS_LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_access_log)
+        
+        # Running total of cached bytes, kept up to date on insert and removal
+        self._total_bytes = self._scan_cache_size()
+        
         logger.info(f"Cache initialized with max size {max_size_mb}MB and TTL {ttl_seconds} seconds")
     
-    def _load_access_log(self) -> Dict[str, Dict[str, float]]:
+    def _load_access_log(self) -> Dict[str, "OrderedDict[str, CacheEntry]"]:
         """"
         Load the access log from disk.
         
         Returns:
-            Dictionary mapping cache types to item IDs and access times
+            Dictionary mapping cache types to item IDs and their entries.
+            Each cache type is ordered from least to most recently used.
         """"
-        if os.path.exists(self.access_log_file):
-            try:
-                with open(self.access_log_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading access log: {e}")
-        
-        # Create a new access log
-        return {
-            "audio": {},
-            "transcription": {},
-            "translation": {},
-            "thumbnail": {}
+        access_log = {
+            "audio": OrderedDict(),
+            "transcription": OrderedDict(),
+            "translation": OrderedDict(),
+            "thumbnail": OrderedDict()
         }
+        
+        try:
+            rows = self._db.execute(
+                "SELECT type, id, atime, size FROM items ORDER BY atime"
+            ).fetchall()
+            
+            # Import the JSON access log used by earlier versions
+            if not rows:
+                rows = self._import_legacy_access_log()
+            
+            for cache_type, item_id, atime, size in rows:
+                access_log.setdefault(cache_type, OrderedDict())[item_id] = CacheEntry(atime, size)
+        except Exception as e:
+            logger.error(f"Error loading access log: {e}")
+        
+        return access_log
+    
+    def _import_legacy_access_log(self) -> List[Tuple[str, str, float, int]]:
+        """"
+        Move entries from a legacy access_log.json file into the database.
+        
+        Returns:
+            Imported rows as (type, id, atime, size), oldest first
+        """"
+        legacy_file = os.path.join(self.cache_dir, "access_log.json")
+        if not os.path.exists(legacy_file):
+            return []
+            
+        with open(legacy_file, 'r') as f:
+            legacy_log = json.load(f)
+        
+        rows = []
+        for cache_type, items in legacy_log.items():
+            cache_dir = getattr(self, f"{cache_type}_cache_dir")
+            for item_id, entry in items.items():
+                # Older logs only stored the access time
+                if not isinstance(entry, dict):
+                    file_path = os.path.join(cache_dir, item_id)
+                    size = os.path.getsize(file_path) if os.path.isfile(file_path) else 0
+                    entry = {"atime": entry, "size": size}
+                rows.append((cache_type, item_id, entry["atime"], entry["size"]))
+        
+        rows.sort(key=lambda row: row[2])
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)", rows)
+        os.remove(legacy_file)
+        
+        logger.info(f"Imported {len(rows)} entries from legacy access log")
+        return rows
     
     def _save_access_log(self) -> None:
-        """Save the access log to disk."""
+        """Write changed and removed access log items to disk."""
+        self._flush_timer.stop()
+        
+        upserts = []
+        for cache_type, item_id in self._dirty_items:
+            entry = self.access_log.get(cache_type, {}).get(item_id)
+            if entry is not None:
+                upserts.append((cache_type, item_id, entry.atime, entry.size))
+        
         try:
-            with open(self.access_log_file, 'w') as f:
-                json.dump(self.access_log, f)
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?)", upserts)
+                self._db.executemany("DELETE FROM items WHERE type = ? AND id = ?", self._deleted_items)
+            self._dirty_items.clear()
+            self._deleted_items.clear()
         except Exception as e:
             logger.error(f"Error saving access log: {e}")
     
-    def _update_access_time(self, cache_type: str, item_id: str) -> None:
+    def _mark_access_log_dirty(self, cache_type: str, item_id: str, deleted: bool = False) -> None:
+        """"
+        Record a changed access log item and schedule a deferred save.
+        
+        Args:
+            cache_type: Type of cache (audio, transcription, translation, thumbnail)
+            item_id: ID of the cached item
+            deleted: Whether the item was removed from the access log
+        """"
+        key = (cache_type, item_id)
+        if deleted:
+            self._dirty_items.discard(key)
+            self._deleted_items.add(key)
+        else:
+            self._deleted_items.discard(key)
+            self._dirty_items.add(key)
+            
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_access_log(self) -> None:
+        """Save the access log if it has unsaved changes."""
+        if self._dirty_items or self._deleted_items:
+            self._save_access_log()
+    
+    def _update_access_time(self, cache_type: str, item_id: str, size: Optional[int] = None) -> None:
         """"
         Update the access time for a cached item.
         
         Args:
             cache_type: Type of cache (audio, transcription, translation, thumbnail)
             item_id: ID of the cached item
+            size: Size in bytes of a newly written item, None for a plain access
         """"
         if cache_type not in self.access_log:
-            self.access_log[cache_type] = {}
+            self.access_log[cache_type] = OrderedDict()
             
-        self.access_log[cache_type][item_id] = time.time()
-        self._save_access_log()
+        items = self.access_log[cache_type]
+        entry = items.get(item_id)
+        
+        if size is None:
+            if entry is not None:
+                entry.atime = time.time()
+                items.move_to_end(item_id)
+                self._mark_access_log_dirty(cache_type, item_id)
+                return
+            
+            # Untracked item found on disk, record its size once
+            cache_dir = getattr(self, f"{cache_type}_cache_dir")
+            size = os.path.getsize(os.path.join(cache_dir, item_id))
+        elif entry is not None:
+            # Overwritten item, its old size no longer counts
+            self._total_bytes -= entry.size
+        else:
+            self._missing_items.get(cache_type, set()).discard(item_id)
+            
+        items[item_id] = CacheEntry(time.time(), size)
+        items.move_to_end(item_id)
+        self._total_bytes += size
+        self._mark_access_log_dirty(cache_type, item_id)
+    
+    def _is_cached(self, cache_type: str, item_id: str, file_path: str) -> bool:
+        """"
+        Check whether a cached item exists, remembering misses.
+        
+        The access log is trusted as the index of cached items; the
+        filesystem is only consulted for items it does not know about.
+        
+        Args:
+            cache_type: Type of cache (audio, transcription, translation, thumbnail)
+            item_id: ID of the cached item
+            file_path: Path of the cached item
+            
+        Returns:
+            True if the item exists, False otherwise
+        """"
+        if item_id in self.access_log.get(cache_type, ()):
+            return True
+            
+        missing = self._missing_items.setdefault(cache_type, set())
+        if item_id in missing:
+            return False
+            
+        if os.path.exists(file_path):
+            return True
+            
+        missing.add(item_id)
+        return False
+    
+    def _forget_item(self, cache_type: str, item_id: str) -> None:
+        """"
+        Remove a deleted item from the access log and the size counter.
+        
+        Args:
+            cache_type: Type of cache (audio, transcription, translation, thumbnail)
+            item_id: ID of the cached item
+        """"
+        entry = self.access_log[cache_type].pop(item_id, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+            self._mark_access_log_dirty(cache_type, item_id, deleted=True)
+    
+    @staticmethod
+    def _dir_files(directory: str) -> List[Tuple[str, float, int]]:
+        """"
+        Walk a directory and list all files.
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            List of (path relative to directory, modification time, size in bytes)
+        """"
+        files = []
+        
+        for root, _, names in os.walk(directory):
+            for name in names:
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                files.append((os.path.relpath(file_path, directory), stat.st_mtime, stat.st_size))
+        
+        return files
+    
+    def _scan_cache_size(self) -> int:
+        """"
+        Scan the cache subdirectories concurrently and register files that
+        are missing from the access log.
+        
+        Untracked files are added with their modification time as access
+        time, so they are counted once and can be evicted like any other item.
+        
+        Returns:
+            Total cache size in bytes
+        """"
+        cache_types = ["audio", "transcription", "translation", "thumbnail"]
+        directories = [getattr(self, f"{cache_type}_cache_dir") for cache_type in cache_types]
+        
+        with ThreadPoolExecutor(max_workers=len(directories)) as executor:
+            scans = list(executor.map(self._dir_files, directories))
+        
+        for cache_type, files in zip(cache_types, scans):
+            items = self.access_log.setdefault(cache_type, OrderedDict())
+            untracked = [file for file in files if file[0] not in items]
+            if not untracked:
+                continue
+                
+            for item_id, mtime, size in untracked:
+                items[item_id] = CacheEntry(mtime, size)
+                self._mark_access_log_dirty(cache_type, item_id)
+            
+            # Keep the type in LRU order
+            self.access_log[cache_type] = OrderedDict(sorted(items.items(), key=lambda item: item[1].atime))
+            logger.info(f"Registered {len(untracked)} untracked {cache_type} cache files")
+        
+        return sum(entry.size for items in self.access_log.values() for entry in items.values())
     
     def _get_cache_size(self) -> float:
         """"
@@ -125,104 +490,122 @@ class CacheManager(QObject):
         Returns:
             Total cache size in megabytes
         """"
-        total_size = 0
-        
-        for root, _, files in os.walk(self.cache_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if os.path.isfile(file_path):
-                    total_size += os.path.getsize(file_path)
+        return self._total_bytes / (1024 * 1024)  # Convert bytes to MB
+    
+    @staticmethod
+    def _iter_lru(cache_type: str, items: "OrderedDict[str, CacheEntry]"):
+        """"
+        Iterate the items of one cache type, least recently used first.
         
-        return total_size / (1024 * 1024)  # Convert bytes to MB
+        Args:
+            cache_type: Type of cache (audio, transcription, translation, thumbnail)
+            items: Access log items of that cache type
+            
+        Yields:
+            Tuples of (access time, cache type, item ID, size in bytes)
+        """"
+        for item_id, entry in items.items():
+            yield entry.atime, cache_type, item_id, entry.size
     
-    def _ensure_cache_size(self) -> None:
+    def _maintain(self, keep: Optional[Tuple[str, str]] = None) -> None:
         """"
-        Ensure the cache size doesn't exceed the maximum size.'
-        Removes least recently used items if needed.
+        Remove expired items and keep the cache within its maximum size.
+        
+        Items are visited once, least recently used first. An item is removed
+        if it has exceeded its TTL or if the cache is still over budget. The
+        scan stops at the first item that is neither, since every later item
+        was used more recently.
+        
+        Args:
+            keep: (cache type, item ID) of an item that must not be removed,
+                such as the item just written
         """"
+        self._writes_since_maintenance = 0
+        self._bytes_since_maintenance = 0
+        
+        now = time.time()
         current_size = self._get_cache_size()
+        over_limit = current_size > self.max_size_mb
+        target_size = self.max_size_mb * 0.9  # Aim for 90% of max size
         
-        if current_size <= self.max_size_mb:
-            return
-            
-        logger.info(f"Cache size ({current_size:.2f}MB) exceeds maximum ({self.max_size_mb}MB). Cleaning up...")
+        if over_limit:
+            logger.info(f"Cache size ({current_size:.2f}MB) exceeds maximum ({self.max_size_mb}MB). Cleaning up...")
         
-        # Collect all items and their access times
-        all_items = []
+        # Each cache type is kept in LRU order, so merging them yields all
+        # items oldest first without sorting the whole log
+        lru_items = heapq.merge(
+            *(self._iter_lru(cache_type, items) for cache_type, items in self.access_log.items()),
+            key=lambda x: x[0]
+        )
         
-        for cache_type, items in self.access_log.items():
-            for item_id, access_time in items.items():
-                cache_dir = getattr(self, f"{cache_type}_cache_dir")
-                file_path = os.path.join(cache_dir, item_id)
+        # Pick expired items and the oldest items until we're under the limit'
+        to_remove = []
+        remove_size = 0
+        expired_count = 0
+        
+        for access_time, cache_type, item_id, size in lru_items:
+            if (cache_type, item_id) == keep:
+                continue
+            
+            expired = now - access_time > self.ttl_seconds
+            over_budget = over_limit and current_size - remove_size > target_size
+            if not expired and not over_budget:
+                break
                 
-                if os.path.exists(file_path):
-                    file_size = os.path.getsize(file_path) / (1024 * 1024)  # Size in MB
-                    all_items.append((cache_type, item_id, access_time, file_path, file_size))
+            file_size = size / (1024 * 1024)  # Size in MB
+            to_remove.append((cache_type, item_id, file_size))
+            remove_size += file_size
+            expired_count += expired
         
-        # Sort by access time (oldest first)
-        all_items.sort(key=lambda x: x[2])
+        if not to_remove:
+            self._flush_access_log()
+            return
         
-        # Delete items until we're under the limit'
+        # Delete the selected items
         deleted_size = 0
         deleted_count = 0
         
-        for cache_type, item_id, _, file_path, file_size in all_items:
-            if current_size - deleted_size <= self.max_size_mb * 0.9:  # Aim for 90% of max size
-                break
-                
+        for cache_type, item_id, file_size in to_remove:
+            cache_dir = getattr(self, f"{cache_type}_cache_dir")
+            file_path = os.path.join(cache_dir, item_id)
+            
             try:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
+                _remove_path(file_path)
                     
                 # Update tracking
                 deleted_size += file_size
                 deleted_count += 1
                 
                 # Remove from access log
-                if item_id in self.access_log[cache_type]:
-                    del self.access_log[cache_type][item_id]
+                self._forget_item(cache_type, item_id)
                     
             except Exception as e:
                 logger.error(f"Error removing cached item {file_path}: {e}")
         
         self._save_access_log()
-        logger.info(f"Removed {deleted_count} cached items ({deleted_size:.2f}MB)")
+        logger.info(f"Removed {deleted_count} cached items ({deleted_size:.2f}MB), "
+                    f"{expired_count} of them expired")
     
-    def _clear_expired_items(self) -> None:
-        """Remove items that have exceeded their TTL."""
-        current_time = time.time()
-        expired_count = 0
+    def _maybe_maintain(self, cache_type: str, item_id: str, written_bytes: int) -> None:
+        """"
+        Run maintenance after a write if the cache is over its size limit
+        or enough writes have accumulated since the last pass.
         
-        for cache_type, items in self.access_log.items():
-            to_remove = []
-            
-            for item_id, access_time in items.items():
-                if current_time - access_time > self.ttl_seconds:
-                    cache_dir = getattr(self, f"{cache_type}_cache_dir")
-                    file_path = os.path.join(cache_dir, item_id)
-                    
-                    if os.path.exists(file_path):
-                        try:
-                            if os.path.isfile(file_path):
-                                os.remove(file_path)
-                            elif os.path.isdir(file_path):
-                                shutil.rmtree(file_path)
-                                
-                            expired_count += 1
-                        except Exception as e:
-                            logger.error(f"Error removing expired item {file_path}: {e}")
-                    
-                    to_remove.append(item_id)
-            
-            # Remove expired items from access log
-            for item_id in to_remove:
-                del self.access_log[cache_type][item_id]
+        The item just written is never evicted, since the caller is about
+        to return its path.
         
-        if expired_count > 0:
-            self._save_access_log()
-            logger.info(f"Removed {expired_count} expired items from cache")
+        Args:
+            cache_type: Type of cache of the item just written
+            item_id: ID of the item just written
+            written_bytes: Number of bytes just written
+        """"
+        self._writes_since_maintenance += 1
+        self._bytes_since_maintenance += written_bytes
+        
+        if (self._get_cache_size() > self.max_size_mb
+                or self._writes_since_maintenance >= MAINTENANCE_WRITE_INTERVAL
+                or self._bytes_since_maintenance >= MAINTENANCE_BYTE_INTERVAL):
+            self._maintain(keep=(cache_type, item_id))
     
     def clear_unused(self, keep_days: int) -> int:
         """"
@@ -241,27 +624,22 @@ class CacheManager(QObject):
         for cache_type, items in self.access_log.items():
             to_remove = []
             
-            for item_id, access_time in items.items():
-                if current_time - access_time > keep_seconds:
+            for item_id, entry in items.items():
+                if current_time - entry.atime > keep_seconds:
                     cache_dir = getattr(self, f"{cache_type}_cache_dir")
                     file_path = os.path.join(cache_dir, item_id)
                     
-                    if os.path.exists(file_path):
-                        try:
-                            if os.path.isfile(file_path):
-                                os.remove(file_path)
-                            elif os.path.isdir(file_path):
-                                shutil.rmtree(file_path)
-                                
+                    try:
+                        if _remove_path(file_path):
                             removed_count += 1
-                        except Exception as e:
-                            logger.error(f"Error removing unused item {file_path}: {e}")
+                    except Exception as e:
+                        logger.error(f"Error removing unused item {file_path}: {e}")
                     
                     to_remove.append(item_id)
             
             # Remove unused items from access log
             for item_id in to_remove:
-                del self.access_log[cache_type][item_id]
+                self._forget_item(cache_type, item_id)
         
         if removed_count > 0:
             self._save_access_log()
@@ -281,19 +659,18 @@ class CacheManager(QObject):
         Returns:
             Path to the cached audio file
         """"
-        # Ensure cache size is within limits
-        self._ensure_cache_size()
-        
         # Create file path
         file_path = os.path.join(self.audio_cache_dir, video_id + ".mp3")
         
         # Write audio data
         try:
-            with open(file_path, 'wb') as f:
-                f.write(audio_data)
+            _write_blob(file_path, audio_data)
                 
             # Update access log
-            self._update_access_time("audio", video_id + ".mp3")
+            self._update_access_time("audio", video_id + ".mp3", len(audio_data))
+            
+            # Keep the cache within its limits
+            self._maybe_maintain("audio", video_id + ".mp3", len(audio_data))
             
             # Emit signal
             self.cache_updated.emit("audio", video_id)
@@ -316,7 +693,7 @@ class CacheManager(QObject):
         """"
         file_path = os.path.join(self.audio_cache_dir, video_id + ".mp3")
         
-        if os.path.exists(file_path):
+        if self._is_cached("audio", video_id + ".mp3", file_path):
             # Update access log
             self._update_access_time("audio", video_id + ".mp3")
             
@@ -336,21 +713,21 @@ class CacheManager(QObject):
         Returns:
             Path to the cached transcription file
         """"
-        # Ensure cache size is within limits
-        self._ensure_cache_size()
-        
         # Create a safe filename with the model included
-        safe_model = model.replace("/", "-").replace("\\", "-")
-        file_name = f"{video_id}_{safe_model}.json"
+        file_name = _transcription_file_name(video_id, model)
         file_path = os.path.join(self.transcription_cache_dir, file_name)
         
         # Write transcription data
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(transcription_data, f, ensure_ascii=False, indent=2)
+            data = _dump_json(transcription_data)
+            with open(file_path, 'wb') as f:
+                f.write(data)
                 
             # Update access log
-            self._update_access_time("transcription", file_name)
+            self._update_access_time("transcription", file_name, len(data))
+            
+            # Keep the cache within its limits
+            self._maybe_maintain("transcription", file_name, len(data))
             
             # Emit signal
             self.cache_updated.emit("transcription", video_id)
@@ -373,14 +750,12 @@ class CacheManager(QObject):
             Transcription data, or None if not found
         """"
         # Create a safe filename with the model included
-        safe_model = model.replace("/", "-").replace("\\", "-")
-        file_name = f"{video_id}_{safe_model}.json"
+        file_name = _transcription_file_name(video_id, model)
         file_path = os.path.join(self.transcription_cache_dir, file_name)
         
-        if os.path.exists(file_path):
+        if self._is_cached("transcription", file_name, file_path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(file_path)
                 
                 # Update access log
                 self._update_access_time("transcription", file_name)
@@ -388,6 +763,7 @@ class CacheManager(QObject):
                 return data
             except Exception as e:
                 logger.error(f"Error loading cached transcription for video {video_id}: {e}")
+                self._forget_item("transcription", file_name)
                 
         return None
     
@@ -405,20 +781,21 @@ class CacheManager(QObject):
         Returns:
             Path to the cached translation file
         """"
-        # Ensure cache size is within limits
-        self._ensure_cache_size()
-        
         # Create a safe filename with language info
         file_name = f"{video_id}_{source_lang}_to_{target_lang}.json"
         file_path = os.path.join(self.translation_cache_dir, file_name)
         
         # Write translation data
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(translation_data, f, ensure_ascii=False, indent=2)
+            data = _dump_json(translation_data)
+            with open(file_path, 'wb') as f:
+                f.write(data)
                 
             # Update access log
-            self._update_access_time("translation", file_name)
+            self._update_access_time("translation", file_name, len(data))
+            
+            # Keep the cache within its limits
+            self._maybe_maintain("translation", file_name, len(data))
             
             # Emit signal
             self.cache_updated.emit("translation", video_id)
@@ -445,10 +822,9 @@ class CacheManager(QObject):
         file_name = f"{video_id}_{source_lang}_to_{target_lang}.json"
         file_path = os.path.join(self.translation_cache_dir, file_name)
         
-        if os.path.exists(file_path):
+        if self._is_cached("translation", file_name, file_path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json(file_path)
                 
                 # Update access log
                 self._update_access_time("translation", file_name)
@@ -456,6 +832,7 @@ class CacheManager(QObject):
                 return data
             except Exception as e:
                 logger.error(f"Error loading cached translation for video {video_id}: {e}")
+                self._forget_item("translation", file_name)
                 
         return None
     
@@ -470,19 +847,18 @@ class CacheManager(QObject):
         Returns:
             Path to the cached thumbnail file
         """"
-        # Ensure cache size is within limits
-        self._ensure_cache_size()
-        
         # Create file path
         file_path = os.path.join(self.thumbnail_cache_dir, video_id + ".jpg")
         
         # Write thumbnail data
         try:
-            with open(file_path, 'wb') as f:
-                f.write(thumbnail_data)
+            _write_blob(file_path, thumbnail_data)
                 
             # Update access log
-            self._update_access_time("thumbnail", video_id + ".jpg")
+            self._update_access_time("thumbnail", video_id + ".jpg", len(thumbnail_data))
+            
+            # Keep the cache within its limits
+            self._maybe_maintain("thumbnail", video_id + ".jpg", len(thumbnail_data))
             
             # Emit signal
             self.cache_updated.emit("thumbnail", video_id)
@@ -505,7 +881,7 @@ class CacheManager(QObject):
         """"
         file_path = os.path.join(self.thumbnail_cache_dir, video_id + ".jpg")
         
-        if os.path.exists(file_path):
+        if self._is_cached("thumbnail", video_id + ".jpg", file_path):
             # Update access log
             self._update_access_time("thumbnail", video_id + ".jpg")
             
@@ -522,21 +898,24 @@ class CacheManager(QObject):
                 for filename in os.listdir(directory):
                     file_path = os.path.join(directory, filename)
                     try:
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
+                        _remove_path(file_path)
                     except Exception as e:
                         logger.error(f"Error removing cached item {file_path}: {e}")
             
             # Reset access log
             self.access_log = {
-                "audio": {},
-                "transcription": {},
-                "translation": {},
-                "thumbnail": {}
+                "audio": OrderedDict(),
+                "transcription": OrderedDict(),
+                "translation": OrderedDict(),
+                "thumbnail": OrderedDict()
             }
-            self._save_access_log()
+            self._dirty_items.clear()
+            self._deleted_items.clear()
+            with self._db:
+                self._db.execute("DELETE FROM items")
+            
+            # Files that could not be removed stay tracked
+            self._total_bytes = self._scan_cache_size()
             
             # Emit signal
             self.cache_cleared.emit()
@@ -577,25 +956,25 @@ class CacheManager(QObject):
             
             # Get file count and size
             if os.path.exists(directory):
-                files = os.listdir(directory)
-                category_stats["count"] = len(files)
-                
-                # Calculate size
+                count = 0
                 size = 0
-                for filename in files:
-                    file_path = os.path.join(directory, filename)
-                    if os.path.isfile(file_path):
-                        size += os.path.getsize(file_path)
                 
+                # scandir entries carry file type (and on Windows, size) from the listing
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        count += 1
+                        if entry.is_file(follow_symlinks=False):
+                            size += entry.stat(follow_symlinks=False).st_size
+                
+                category_stats["count"] = count
                 category_stats["size_mb"] = size / (1024 * 1024)
                 
                 # Get age information
                 current_time = time.time()
                 access_times = []
                 
-                for item_id in self.access_log.get(category, {}):
-                    access_time = self.access_log[category][item_id]
-                    access_times.append(access_time)
+                for entry in self.access_log.get(category, {}).values():
+                    access_times.append(entry.atime)
                 
                 if access_times:
                     oldest = min(access_times)
@@ -622,7 +1001,7 @@ class CacheManager(QObject):
         logger.info(f"Cache max size set to {max_size_mb}MB")
         
         # Ensure cache is within new limits
-        self._ensure_cache_size()
+        self._maintain()
     
     def set_ttl(self, ttl_seconds: int) -> None:
         """"
@@ -638,10 +1017,11 @@ class CacheManager(QObject):
         logger.info(f"Cache TTL set to {ttl_seconds} seconds")
         
         # Clear expired items
-        self._clear_expired_items()
+        self._maintain()
     
     def stop(self) -> None:
         """Clean up resources before stopping."""
         # Save access log
         self._save_access_log()
+        self._db.close()
         logger.info("Cache manager stopped")
@@ -3,8 +3,11 @@ Core translation pipeline module that integrates all components of the translato
 """"
 
 import os
+import asyncio
 import logging
-from typing import Dict, Any, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List
 
 from src.utils.youtube_utils import download_youtube_audio, extract_video_id
 from src.utils.cache_manager import CacheManager
@@ -15,7 +18,10 @@ from src.utils.error_handling import TranslationError, YouTubeError, Transcripti
 # Set up logging
 logger = logging.getLogger(__name__)
 
-def translate_youtube_video()
+# Cache calls run in worker threads; the lock keeps them from interleaving
+_cache_lock = threading.Lock()
+
+def translate_youtube_video(
     url: str,
     source_language: str = "auto",
     target_language: str = "en",
@@ -37,6 +43,125 @@ def translate_youtube_video()
         use_cache: Whether to use cached results when available
         progress_callback: Optional callback for progress updates
     
+    Returns:
+        Dictionary with video info, transcription, and translation
+    """"
+    def run_pipeline():
+        return asyncio.run(translate_youtube_video_async(
+            url,
+            source_language=source_language,
+            target_language=target_language,
+            cache_manager=cache_manager,
+            output_dir=output_dir,
+            use_cache=use_cache,
+            progress_callback=progress_callback
+        ))
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run_pipeline()
+    
+    # Called from a running event loop, which asyncio.run can't nest in;
+    # run the pipeline on its own loop in a worker thread instead
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_pipeline).result()
+
+
+async def translate_youtube_videos(
+    urls: List[str],
+    transcription_slots: int = 1,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """"
+    Process several YouTube videos concurrently.
+    
+    Downloads and translations of different videos overlap, while at most
+    transcription_slots transcriptions run at the same time.
+    
+    Args:
+        urls: YouTube video URLs
+        transcription_slots: Maximum number of concurrent transcriptions
+        **kwargs: Options passed to translate_youtube_video_async
+    
+    Returns:
+        List of results in the order of urls
+    """"
+    # All videos share one cache manager so they update the same index
+    if kwargs.get("cache_manager") is None:
+        kwargs["cache_manager"] = CacheManager()
+    
+    semaphore = asyncio.Semaphore(transcription_slots)
+    return await asyncio.gather(*(
+        translate_youtube_video_async(url, transcription_semaphore=semaphore, **kwargs)
+        for url in urls
+    ))
+
+
+async def _cache_call(func, *args) -> Any:
+    """"
+    Run a cache manager call in a worker thread, one call at a time.
+    
+    Args:
+        func: Cache manager method to call
+        *args: Arguments for the call
+    
+    Returns:
+        The result of the call
+    """"
+    def call():
+        with _cache_lock:
+            return func(*args)
+    
+    return await asyncio.to_thread(call)
+
+
+async def _transcribe(audio_path: str, language: str,
+                      semaphore: Optional[asyncio.Semaphore]) -> Any:
+    """"
+    Transcribe audio in a worker thread, holding the transcription semaphore if given.
+    
+    Args:
+        audio_path: Path of the audio file
+        language: Source language for transcription
+        semaphore: Semaphore limiting concurrent transcriptions, or None
+    
+    Returns:
+        Transcription result
+    """"
+    if semaphore is None:
+        return await asyncio.to_thread(transcribe_audio, audio_file=audio_path, language=language)
+    
+    async with semaphore:
+        return await asyncio.to_thread(transcribe_audio, audio_file=audio_path, language=language)
+
+
+async def translate_youtube_video_async(
+    url: str,
+    source_language: str = "auto",
+    target_language: str = "en",
+    cache_manager: Optional[CacheManager] = None,
+    output_dir: Optional[str] = None,
+    use_cache: bool = True,
+    progress_callback: Optional[callable] = None,
+    transcription_semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict[str, Any]:
+    """"
+    Asynchronous version of translate_youtube_video.
+    
+    The download, transcription and translation steps run in worker threads
+    so several videos can be processed concurrently on one event loop.
+    
+    Args:
+        url: YouTube video URL
+        source_language: Source language for transcription
+        target_language: Target language for translation
+        cache_manager: CacheManager instance for caching
+        output_dir: Directory to save output files
+        use_cache: Whether to use cached results when available
+        progress_callback: Optional callback for progress updates
+        transcription_semaphore: Semaphore limiting concurrent transcriptions
+    
     Returns:
         Dictionary with video info, transcription, and translation
     """"
@@ -55,19 +180,25 @@ def translate_youtube_video()
         if cache_manager is None:
             cache_manager = CacheManager()
         
-        # 1. Download audio (or use cached)
+        # Probe the cache for all stages at once
         audio_path = None
         video_info = None
+        transcription = None
+        translation = None
         
         if use_cache:
-            audio_path = cache_manager.get_cached_audio(video_id)
+            audio_path, transcription, translation = await _cache_call(
+                cache_manager.probe_all, video_id, source_language, source_language, target_language
+            )
         
+        # 1. Download audio (or use cached)
         if not audio_path:
             logger.info(f"Downloading audio for video {video_id}...")
             if progress_callback:
                 progress_callback(0.1, "Downloading audio...")
                 
-            audio_path, video_info = download_youtube_audio()
+            audio_path, video_info = await asyncio.to_thread(
+                download_youtube_audio,
                 url=url,
                 output_dir=output_dir or os.path.join(os.path.expanduser("~"), "youtube_translator"),
                 progress_callback=lambda p, m: progress_callback(p * 0.4, m) if progress_callback else None
@@ -75,11 +206,11 @@ def translate_youtube_video()
             
             # Cache the downloaded audio
             if cache_manager.enabled:
-                cache_manager.cache_audio(video_id, audio_path)
+                await _cache_call(cache_manager.cache_audio, video_id, audio_path)
         else:
             logger.info(f"Using cached audio for video {video_id}")
             # Get video info from cache metadata
-            video_info = cache_manager.get_video_info(video_id) or {}
+            video_info = await _cache_call(cache_manager.get_video_info, video_id) or {}
             
             if progress_callback:
                 progress_callback(0.4, "Using cached audio...")
@@ -88,24 +219,16 @@ def translate_youtube_video()
         result["video_info"] = video_info or {}
         
         # 2. Transcribe audio (or use cached)
-        transcription = None
-        
-        if use_cache:
-            transcription = cache_manager.get_cached_transcription(video_id, source_language)
-            
         if not transcription:
             logger.info(f"Transcribing audio for video {video_id}...")
             if progress_callback:
                 progress_callback(0.5, "Transcribing audio...")
                 
-            transcription = transcribe_audio()
-                audio_file=audio_path,
-                language=source_language
-            )
+            transcription = await _transcribe(audio_path, source_language, transcription_semaphore)
             
             # Cache the transcription
             if cache_manager.enabled:
-                cache_manager.cache_transcription(video_id, source_language, transcription)
+                await _cache_call(cache_manager.cache_transcription, video_id, source_language, transcription)
         else:
             logger.info(f"Using cached transcription for video {video_id}")
             if progress_callback:
@@ -115,17 +238,13 @@ def translate_youtube_video()
         result["transcription"] = transcription
         
         # 3. Translate text (or use cached)
-        translation = None
-        
-        if use_cache:
-            translation = cache_manager.get_cached_translation(video_id, source_language, target_language)
-            
         if not translation:
             logger.info(f"Translating transcription for video {video_id} from {source_language} to {target_language}...")
             if progress_callback:
                 progress_callback(0.8, "Translating text...")
                 
-            translation = translate_text()
+            translation = await asyncio.to_thread(
+                translate_text,
                 text=transcription,
                 source_lang=source_language,
                 target_lang=target_language
@@ -133,7 +252,9 @@ def translate_youtube_video()
             
             # Cache the translation
             if cache_manager.enabled:
-                cache_manager.cache_translation(video_id, source_language, target_language, translation)
+                await _cache_call(
+                    cache_manager.cache_translation, video_id, source_language, target_language, translation
+                )
         else:
             logger.info(f"Using cached translation for video {video_id}")
             if progress_callback:
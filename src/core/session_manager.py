@@ -6,30 +6,92 @@ Handles saving and restoring application state.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 try:
         try:
-    from PyQt6.QtCore import QObject, pyqtSignal
+    from PyQt6.QtCore import QByteArray, QObject, QSettings, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QByteArray, QObject, QSettings, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QByteArray, QObject, QSettings, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QByteArray, QObject, QSettings, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QByteArray, QObject, QSettings, pyqtSignal
 except ImportError:
-    from PyQt5.QtCore import QObject, pyqtSignal
+    from PyQt5.QtCore import QByteArray, QObject, QSettings, pyqtSignal
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
+# Version of the stored session format
+SESSION_FORMAT_VERSION = 3
+
+# Maximum number of threads checking restored files in parallel
+EXISTENCE_CHECK_WORKERS = 16
+
+# Session file written by versions that stored the session as JSON
+LEGACY_SESSION_FILE = os.path.join(os.path.expanduser("~"), ".youtube_translator_pro", "session.json")
+
+
+def _existing_in_directory(directory: str, paths: List[str]) -> List[str]:
+    """"
+    Find which of the given paths in one directory are existing files.
+    
+    Args:
+        directory: Parent directory shared by all paths
+        paths: File paths to check
+        
+    Returns:
+        The paths that exist as files
+    """"
+    if len(paths) == 1:
+        return paths if os.path.isfile(paths[0]) else []
+    
+    try:
+        with os.scandir(directory or '.') as it:
+            present = {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return []
+    return [path for path in paths if os.path.basename(path) in present]
+
+
+def _existing_files(paths) -> set:
+    """"
+    Find which of the given paths are existing files.
+    
+    Paths are grouped by directory so each directory is listed once with
+    os.scandir instead of stat-ing every path. Directories are checked in
+    parallel, since each check mostly waits on the file system.
+    
+    Args:
+        paths: File paths to check
+        
+    Returns:
+        Set of the paths that exist as files
+    """"
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+    
+    if len(by_dir) <= 1:
+        return {path for directory, dir_paths in by_dir.items()
+                for path in _existing_in_directory(directory, dir_paths)}
+    
+    existing = set()
+    with ThreadPoolExecutor(max_workers=min(EXISTENCE_CHECK_WORKERS, len(by_dir))) as executor:
+        for found in executor.map(_existing_in_directory, by_dir.keys(), by_dir.values()):
+            existing.update(found)
+    return existing
+
 class SessionManager(QObject):
     """"
     Manages application session state.
     Handles saving and restoring application state across runs.
+    The session is stored with QSettings in INI format.
     """"
     
     session_restored = pyqtSignal(dict)
@@ -40,22 +102,71 @@ class SessionManager(QObject):
         Initialize the session manager.
         
         Args:
-            session_file: Path to the session file
+            session_file: Path to the session file, defaults to the per-user settings location
             parent: Parent QObject
         """"
         super().__init__(parent)
         
-        # Set default session file if not provided
         if session_file is None:
-            home_dir = os.path.expanduser("~")
-            session_file = os.path.join(home_dir, ".youtube_translator_pro", "session.json")
+            self.settings = QSettings(QSettings.Format.IniFormat, QSettings.Scope.UserScope,
+                                      "YouTubeTranslatorPro", "session")
+        else:
+            self.settings = QSettings(session_file, QSettings.Format.IniFormat)
             
-        self.session_file = session_file
+        self.session_file = self.settings.fileName()
         
-        # Create directory if it doesn't exist'
-        os.makedirs(os.path.dirname(session_file), exist_ok=True)
+        if session_file is None and not self.settings.contains("version"):
+            self._import_legacy_session(LEGACY_SESSION_FILE)
         
-        logger.info(f"Session manager initialized with session file {session_file}")
+        logger.info(f"Session manager initialized with session file {self.session_file}")
+    
+    def _import_legacy_session(self, legacy_file: str) -> bool:
+        """"
+        Copy a session saved as JSON by an older version into the settings store.
+        
+        The JSON file is renamed afterwards so it is imported only once.
+        
+        Args:
+            legacy_file: Path to the old session.json
+            
+        Returns:
+            True if a session was imported, False otherwise
+        """"
+        if not os.path.isfile(legacy_file):
+            return False
+            
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                session_data = json.load(f)
+            
+            # Geometry is either base64 in the JSON or raw bytes in a sidecar file
+            geometry = QByteArray()
+            geometry_file = legacy_file + '.geom'
+            if os.path.isfile(geometry_file):
+                with open(geometry_file, 'rb') as f:
+                    geometry = QByteArray(f.read())
+            elif session_data.get("window", {}).get("geometry"):
+                geometry = QByteArray.fromBase64(session_data["window"]["geometry"].encode('utf-8'))
+            
+            files = session_data.get("files", {})
+            settings = self.settings
+            settings.setValue("version", SESSION_FORMAT_VERSION)
+            settings.setValue("timestamp", session_data.get("timestamp", ""))
+            if not geometry.isEmpty():
+                settings.setValue("window/geometry", geometry)
+            settings.setValue("files/open", files.get("open", []))
+            settings.setValue("files/recent", files.get("recent", []))
+            settings.sync()
+            
+            os.replace(legacy_file, legacy_file + '.imported')
+            if os.path.isfile(geometry_file):
+                os.replace(geometry_file, geometry_file + '.imported')
+                
+            logger.info(f"Imported legacy session from {legacy_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to import legacy session: {e}")
+            return False
     
     def save_session(self, main_window) -> bool:
         """"
@@ -68,9 +179,6 @@ class SessionManager(QObject):
             True if session was saved successfully, False otherwise
         """"
         try:
-                # Get window geometry
-            geometry = main_window.saveGeometry().toBase64().data().decode('utf-8')
-            
             # Get open files
             open_files = []
             if hasattr(main_window, 'get_open_files'):
@@ -83,19 +191,25 @@ class SessionManager(QObject):
                 
             # Create session data
             session_data = {
+                "version": SESSION_FORMAT_VERSION,
                 "timestamp": datetime.now().isoformat(),
-                "window": {
-                    "geometry": geometry
-                },
                 "files": {
                     "open": open_files,
                     "recent": recent_files
                 }
             }
             
-            # Save to file
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2)
+            # Store the session; QSettings keeps the geometry QByteArray as-is
+            settings = self.settings
+            settings.setValue("version", SESSION_FORMAT_VERSION)
+            settings.setValue("timestamp", session_data["timestamp"])
+            settings.setValue("window/geometry", main_window.saveGeometry())
+            settings.setValue("files/open", open_files)
+            settings.setValue("files/recent", recent_files)
+            settings.sync()
+            
+            if settings.status() != QSettings.Status.NoError:
+                raise OSError(f"Could not write {self.session_file}")
                 
             logger.info(f"Session saved successfully: {len(open_files)} open files")
             
@@ -117,41 +231,42 @@ class SessionManager(QObject):
         Returns:
             True if session was restored successfully, False otherwise
         """"
-        if not os.path.exists(self.session_file):
+        settings = self.settings
+        if not settings.contains("version"):
             logger.info("No session file found, starting with clean session")
             return False
             
         try:
                 # Load session data
-            with open(self.session_file, 'r', encoding='utf-8') as f:
-                session_data = json.load(f)
+            session_data = {
+                "version": settings.value("version", type=int),
+                "timestamp": settings.value("timestamp", "", type=str),
+                "files": {
+                    "open": settings.value("files/open", [], type=list),
+                    "recent": settings.value("files/recent", [], type=list)
+                }
+            }
                 
             # Restore window geometry
-            if "window" in session_data and "geometry" in session_data["window"]:
-                try:
-        try:
-    from PyQt6.QtCore import QByteArray
-except ImportError:
-    from PyQt5.QtCore import QByteArray
-except ImportError:
-    from PyQt5.QtCore import QByteArray
-except ImportError:
-    from PyQt5.QtCore import QByteArray
-                geometry = QByteArray.fromBase64(session_data["window"]["geometry"].encode('utf-8'))
+            geometry = settings.value("window/geometry", QByteArray(), type=QByteArray)
+            if not geometry.isEmpty():
                 main_window.restoreGeometry(geometry)
                 
             # Restore files
             if "files" in session_data:
+                files = session_data["files"]
+                existing = _existing_files(files.get("open", []) + files.get("recent", []))
+                
                 # Restore open files
-                if "open" in session_data["files"] and hasattr(main_window, 'open_files'):
-                    for file_path in session_data["files"]["open"]:
-                        if os.path.exists(file_path):
+                if "open" in files and hasattr(main_window, 'open_files'):
+                    for file_path in files["open"]:
+                        if file_path in existing:
                             main_window.open_files(file_path)
                             
                 # Restore recent files
-                if "recent" in session_data["files"] and hasattr(main_window, 'add_recent_file'):
-                    for file_path in session_data["files"]["recent"]:
-                        if os.path.exists(file_path):
+                if "recent" in files and hasattr(main_window, 'add_recent_file'):
+                    for file_path in files["recent"]:
+                        if file_path in existing:
                             main_window.add_recent_file(file_path)
                             
             logger.info(f"Session restored successfully from {self.session_file}")
@@ -171,12 +286,13 @@ except ImportError:
         Returns:
             True if session was cleared successfully, False otherwise
         """"
-        if not os.path.exists(self.session_file):
+        if not self.settings.contains("version"):
             logger.info("No session file to clear")
             return True
             
         try:
-                os.remove(self.session_file)
+                self.settings.clear()
+            self.settings.sync()
             logger.info("Session file cleared")
             return True
         except Exception as e:
@@ -4,49 +4,76 @@ Handles the transcription of audio files using Whisper models.
 """"
 
 import os
+import sys
 import gc
 import time
+import queue
+import asyncio
 import signal
+import itertools
+import threading
 import logging
 import multiprocessing
+import multiprocessing.connection
 import psutil
 import atexit
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Callable, Union
 from multiprocessing import Process, Queue, Event, Value
 from contextlib import contextmanager
+from concurrent.futures import Future
 from functools import lru_cache
 
-# Import whisper conditionally to allow for mock testing
-try:
-    import whisper
-    import numpy as np
-    import torch
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
+# whisper, numpy and torch are imported lazily inside the worker process, so
+# importing this module does not pay the torch import cost in the GUI process
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+FASTER_WHISPER_AVAILABLE = importlib.util.find_spec("faster_whisper") is not None
 
 # Import configuration
-from src.config import DEFAULT_TRANSCRIPTION_TIMEOUT, TRANSCRIPTION_MODELS
+from src.config import (
+    DEFAULT_TRANSCRIPTION_TIMEOUT, TRANSCRIPTION_MODELS, TRANSCRIPTION_BACKEND, TRANSCRIPTION_TORCH_COMPILE
+)
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
 # Global tracking of active processes for cleanup
 _active_processes = set()
-_process_lock = multiprocessing.RLock()
+_process_lock = threading.Lock()  # Only threads of this process share the set
+
+# Pool workers are started through a fork server where available: forking the
+# multi-threaded GUI process is unsafe and a forked child cannot use CUDA
+_mp_context = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 
 # Memory management settings
 GPU_MEMORY_THRESHOLD = 0.9  # Trigger cleanup when GPU memory usage exceeds 90%
 CPU_MEMORY_THRESHOLD = 0.85  # Trigger cleanup when system memory exceeds 85%
 MAX_CACHE_SIZE = 2  # Maximum number of Whisper models to keep loaded in memory
 
+_VALID_MODELS = frozenset(TRANSCRIPTION_MODELS)
+
+# Use CTranslate2 int8 inference when it is configured and installed
+USE_FASTER_WHISPER = TRANSCRIPTION_BACKEND == "faster-whisper" and FASTER_WHISPER_AVAILABLE
+
+# Controller settings
+STOP_CHECK_INTERVAL = 1.0  # Seconds between stop request checks while waiting for a job
+RESULT_WAIT_TIMEOUT = 5.0  # Seconds to wait for the result once the worker signalled completion
+WHISPER_SAMPLE_RATE = 16000  # Sample rate expected by Whisper models
+PROCESS_TERMINATE_TIMEOUT = 1.0  # Seconds to wait for processes to exit before killing them
+
 # Register cleanup on exit
 @atexit.register
 def _cleanup_on_exit():
-    """Ensure all processes are terminated on program exit."""
+    """"
+    Ensure all processes are terminated on program exit.
+    
+    The model cache is not cleared here; the OS reclaims that memory anyway
+    and gc.collect() plus a CUDA sync would only slow down shutdown.
+    """"
     _terminate_all_processes()
-    _clear_model_cache()
     logger.debug("Transcription cleanup complete on exit")
 
 
@@ -66,35 +93,138 @@ def _terminate_all_processes():
     """Terminate all actively tracked processes."""
     logger.info("Terminating all active transcription processes...")
     with _process_lock:
-        for process in list(_active_processes):  # Iterate over a copy
-            if process.is_alive():
-                try:
-                    logger.debug(f"Terminating process {process.pid} ({process.name})...")
-                    process.terminate()
-                    # Give it a moment to terminate
-                    process.join(timeout=1.0)
-                    if process.is_alive():
-                        logger.warning(f"Process {process.pid} did not terminate gracefully. Killing.")
-                        try:
-                            process.kill()  # Force kill if terminate fails
-                            process.join(timeout=1.0)
-                        except Exception as kill_err:
-                            logger.error(f"Failed to kill process {process.pid}: {kill_err}")
-
-                    logger.debug(f"Process {process.pid} terminated.")
-                except Exception as e:
-                    logger.error(f"Error terminating process {process.pid}: {e}")
+        processes = list(_active_processes)
         _active_processes.clear()
+    
+    # Signal every process first, then wait for all of them against one deadline
+    remaining = []
+    for process in processes:
+        try:
+            if process.is_alive():
+                logger.debug(f"Terminating process {process.pid} ({process.name})...")
+                process.terminate()
+                remaining.append(process)
+        except Exception as e:
+            logger.error(f"Error terminating process {process.pid}: {e}")
+    
+    deadline = time.monotonic() + PROCESS_TERMINATE_TIMEOUT
+    while remaining:
+        wait_time = deadline - time.monotonic()
+        if wait_time <= 0:
+            break
+        # Sentinels become ready when a process exits; exitcode reaps it
+        multiprocessing.connection.wait([process.sentinel for process in remaining], wait_time)
+        remaining = [process for process in remaining if process.exitcode is None]
+    
+    for process in remaining:
+        logger.warning(f"Process {process.pid} did not terminate gracefully. Killing.")
+        try:
+            process.kill()  # Force kill if terminate fails
+            process.join(timeout=1.0)
+        except Exception as kill_err:
+            logger.error(f"Failed to kill process {process.pid}: {kill_err}")
     logger.info("All active transcription processes terminated.")
 
 
 # ===== Model Loading and Caching =====
 
+def _torch_cuda_available() -> bool:
+    """Check for CUDA through torch, importing it on first use."""
+    import torch
+    return torch.cuda.is_available()
+
+
+def _resolve_device(device: str) -> str:
+    """"
+    Resolve the 'auto' device to 'cuda' or 'cpu'.
+
+    The faster-whisper backend asks CTranslate2 for CUDA devices, so torch
+    is never imported on that path.
+
+    Args:
+        device: 'auto', 'cpu' or 'cuda'.
+
+    Returns:
+        The device to run the model on.
+    """"
+    if device != "auto":
+        return device
+    if USE_FASTER_WHISPER:
+        import ctranslate2
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    return "cuda" if _torch_cuda_available() else "cpu"
+
+
+def _check_memory_for(model_name: str, device: str):
+    """"
+    Check that there is enough free memory to load a model.
+
+    Args:
+        model_name: The name of the model to load.
+        device: The device the model will be loaded onto ('cpu' or 'cuda').
+
+    Raises:
+        RuntimeError: If there is not enough free memory for the model.
+    """"
+    if device == 'cuda' and USE_FASTER_WHISPER:
+        # CTranslate2 cannot report free GPU memory, and importing torch just
+        # for this check would cancel the backend's startup and memory savings
+        logger.debug("Skipping GPU memory check for the faster-whisper backend")
+
+    elif device == 'cuda' and _torch_cuda_available():
+        import torch
+
+        # Check GPU memory; freed blocks are reused by the allocator, so no empty_cache() here
+        gpu_memory_info = torch.cuda.mem_get_info()  # returns (free, total)
+        free_gpu_memory_gb = gpu_memory_info[0] / (1024**3)
+        total_gpu_memory_gb = gpu_memory_info[1] / (1024**3)
+        logger.debug(f"GPU memory: {free_gpu_memory_gb:.2f} GB free / {total_gpu_memory_gb:.2f} GB total")
+
+        # Estimate model size (rough estimates)
+        model_sizes_gb = {
+            "tiny": 0.074,  # ~74 MB
+            "base": 0.148,  # ~148 MB
+            "small": 0.498,  # ~498 MB
+            "medium": 1.53,  # ~1.53 GB
+            "large": 3.07  # ~3.07 GB
+        }
+        estimated_model_size_gb = model_sizes_gb.get(model_name, 0)
+
+        # Allow buffer for overhead
+        required_free_gpu_memory_gb = estimated_model_size_gb * 1.2  # Require 20% buffer
+
+        if free_gpu_memory_gb < required_free_gpu_memory_gb:
+            raise RuntimeError(f"Insufficient GPU memory to load model '{model_name}'. Requires ~{required_free_gpu_memory_gb:.2f} GB free, but only {free_gpu_memory_gb:.2f} GB available.")
+
+    elif device == 'cpu':
+        # Check system RAM
+        mem_info = psutil.virtual_memory()
+        free_ram_gb = mem_info.available / (1024**3)
+        total_ram_gb = mem_info.total / (1024**3)
+        logger.debug(f"System RAM: {free_ram_gb:.2f} GB free / {total_ram_gb:.2f} GB total")
+
+        # CPU models also require significant RAM
+        cpu_model_sizes_gb = {
+            "tiny": 0.2,
+            "base": 0.5,
+            "small": 1.5,
+            "medium": 4.0,
+            "large": 8.0
+        }
+        estimated_model_size_gb = cpu_model_sizes_gb.get(model_name, 0)
+        required_free_ram_gb = estimated_model_size_gb * 1.5  # Require 50% buffer
+
+        if free_ram_gb < required_free_ram_gb:
+            raise RuntimeError(f"Insufficient system RAM to load model '{model_name}' on CPU. Requires ~{required_free_ram_gb:.2f} GB free, but only {free_ram_gb:.2f} GB available.")
+
+
 @lru_cache(maxsize=MAX_CACHE_SIZE)
 def _load_whisper_model(model_name: str, device: str) -> "whisper.Whisper":
     """"
     Load a Whisper model, caching recent ones.
 
+    The memory check only runs here, so cache hits skip it entirely.
+
     Args:
         model_name: The name of the model to load.
         device: The device to load the model onto ('cpu' or 'cuda').
@@ -105,59 +235,24 @@ def _load_whisper_model(model_name: str, device: str) -> "whisper.Whisper":
     Raises:
         RuntimeError: If Whisper is not available or model loading fails.
     """"
-    if not WHISPER_AVAILABLE:
+    if not (USE_FASTER_WHISPER or WHISPER_AVAILABLE):
         raise RuntimeError("Whisper library is not available.")
 
     logger.info(f"Loading Whisper model '{model_name}' on '{device}'...")
     try:
-        # Check available memory before loading large models
-        if device == 'cuda' and torch.cuda.is_available():
-            # Check GPU memory
-            torch.cuda.empty_cache()  # Clear cache before checking
-            gpu_memory_info = torch.cuda.mem_get_info()  # returns (free, total)
-            free_gpu_memory_gb = gpu_memory_info[0] / (1024**3)
-            total_gpu_memory_gb = gpu_memory_info[1] / (1024**3)
-            logger.debug(f"GPU memory: {free_gpu_memory_gb:.2f} GB free / {total_gpu_memory_gb:.2f} GB total")
-
-            # Estimate model size (rough estimates)
-            model_sizes_gb = {
-                "tiny": 0.074,  # ~74 MB
-                "base": 0.148,  # ~148 MB
-                "small": 0.498,  # ~498 MB
-                "medium": 1.53,  # ~1.53 GB
-                "large": 3.07  # ~3.07 GB
-            }
-            estimated_model_size_gb = model_sizes_gb.get(model_name, 0)
-
-            # Allow buffer for overhead
-            required_free_gpu_memory_gb = estimated_model_size_gb * 1.2  # Require 20% buffer
-
-            if free_gpu_memory_gb < required_free_gpu_memory_gb:
-                raise RuntimeError(f"Insufficient GPU memory to load model '{model_name}'. Requires ~{required_free_gpu_memory_gb:.2f} GB free, but only {free_gpu_memory_gb:.2f} GB available.")
-
-        elif device == 'cpu':
-            # Check system RAM
-            mem_info = psutil.virtual_memory()
-            free_ram_gb = mem_info.available / (1024**3)
-            total_ram_gb = mem_info.total / (1024**3)
-            logger.debug(f"System RAM: {free_ram_gb:.2f} GB free / {total_ram_gb:.2f} GB total")
-
-            # CPU models also require significant RAM
-            cpu_model_sizes_gb = {
-                "tiny": 0.2,
-                "base": 0.5,
-                "small": 1.5,
-                "medium": 4.0,
-                "large": 8.0
-            }
-            estimated_model_size_gb = cpu_model_sizes_gb.get(model_name, 0)
-            required_free_ram_gb = estimated_model_size_gb * 1.5  # Require 50% buffer
-
-            if free_ram_gb < required_free_ram_gb:
-                raise RuntimeError(f"Insufficient system RAM to load model '{model_name}' on CPU. Requires ~{required_free_ram_gb:.2f} GB free, but only {free_ram_gb:.2f} GB available.")
+        # Check available memory right before loading
+        _check_memory_for(model_name, device)
 
         # Load the model
-        model = whisper.load_model(model_name, device=device)
+        if USE_FASTER_WHISPER:
+            import faster_whisper
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+            model = faster_whisper.WhisperModel(model_name, device=device, compute_type=compute_type)
+        else:
+            import whisper
+            model = whisper.load_model(model_name, device=device)
+            if TRANSCRIPTION_TORCH_COMPILE and device == "cuda":
+                _compile_model(model)
         logger.info(f"Whisper model '{model_name}' loaded successfully.")
         return model
 
@@ -169,75 +264,160 @@ def _load_whisper_model(model_name: str, device: str) -> "whisper.Whisper":
         raise RuntimeError(f"Failed to load Whisper model '{model_name}': {e}")
 
 
+def _compile_model(model: "whisper.Whisper"):
+    """"
+    Specialize a CUDA Whisper model for repeated jobs with torch.compile.
+
+    Only the encoder is compiled: it always sees fixed 30-second mel windows,
+    while the decoder's growing key/value cache would keep recompiling.
+    Since the model stays cached in the pool worker, the one-off tracing
+    cost is paid by the first job only.
+
+    Args:
+        model: The loaded Whisper model.
+    """"
+    import torch
+
+    if not hasattr(torch, "compile"):
+        return
+
+    # Allow TF32 matmuls on Ampere and newer GPUs
+    torch.set_float32_matmul_precision("high")
+    model.encoder = torch.compile(model.encoder, mode="reduce-overhead", fullgraph=False)
+    logger.info("Whisper encoder compiled with torch.compile")
+
+
 def _clear_model_cache():
     """Clear the LRU cache for Whisper models."""
     logger.info("Clearing Whisper model cache...")
     _load_whisper_model.cache_clear()
     # Also attempt to release memory
     gc.collect()
-    if torch.cuda.is_available():
+    torch = sys.modules.get("torch")  # Nothing to release if torch was never imported
+    if torch is not None and torch.cuda.is_available():
         torch.cuda.empty_cache()
     logger.info("Whisper model cache cleared.")
 
 
 # ===== Worker Process Function =====
 
-def _transcribe_worker()
+def _send_result(progress_queue: Queue, result_queue: Queue, job_id: int, result: Optional[Dict[str, Any]], error: Optional[str]):
+    """Signal completion of a job on the progress queue, then hand over its result."""
+    progress_queue.put((job_id, 1.0, None))
+    result_queue.put((job_id, result, error))
+
+def _load_audio(audio_path: str) -> "np.ndarray":
+    """"
+    Load an audio file as a mono 16 kHz float32 waveform.
+    
+    The faster-whisper backend decodes with its own PyAV-based loader, so
+    torch stays unloaded. Otherwise torchaudio decodes in-process when
+    installed, falling back to whisper's ffmpeg-based loader. The full file
+    is returned, since model.transcribe windows long audio itself.
+    
+    Args:
+        audio_path: Path to the audio file.
+        
+    Returns:
+        The waveform samples.
+    """"
+    if USE_FASTER_WHISPER:
+        import faster_whisper
+        return faster_whisper.decode_audio(audio_path, sampling_rate=WHISPER_SAMPLE_RATE)
+    
+    try:
+        import torchaudio
+    except ImportError:
+        import whisper
+        return whisper.load_audio(audio_path)
+    
+    waveform, sample_rate = torchaudio.load(audio_path)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        waveform = torchaudio.functional.resample(waveform, sample_rate, WHISPER_SAMPLE_RATE)
+    return waveform.mean(dim=0).numpy()
+
+def _transcribe_faster_whisper(model: "faster_whisper.WhisperModel", audio: "np.ndarray", options: Dict[str, Any]) -> Dict[str, Any]:
+    """"
+    Transcribe audio with faster-whisper and return a whisper-style result.
+    
+    Args:
+        model: The loaded faster-whisper model.
+        audio: Audio samples at 16 kHz.
+        options: Transcription options.
+        
+    Returns:
+        Result dictionary with 'text', 'segments' and 'language' keys.
+    """"
+    segments, info = model.transcribe(audio, **options)
+    result_segments = [
+        {"id": i, "start": segment.start, "end": segment.end, "text": segment.text}
+        for i, segment in enumerate(segments)
+    ]
+    return {
+        "text": "".join(segment["text"] for segment in result_segments),
+        "segments": result_segments,
+        "language": info.language
+    }
+
+def _transcribe_worker(
+    job_id: int,
     audio_path: str,
     model_name: str,
     device: str,
     result_queue: Queue,
     progress_queue: Queue,
-    stop_event: Event,
+    stop_event: "_JobStopFlag",
     language: Optional[str] = None
 ):
     """"
-    Worker process function to perform transcription.
+    Perform one transcription job inside a pool worker process.
     
     Args:
+        job_id: Identifier echoed back with every progress update and result.
         audio_path: Path to the audio file to transcribe.
         model_name: Name of the Whisper model to use.
         device: Device to run the model on ('cpu' or 'cuda').
         result_queue: Queue to put the results into.
         progress_queue: Queue to report progress.
-        stop_event: Event to signal cancellation.
+        stop_event: Flag signalling cancellation of this job.
         language: Optional language code for transcription.
     """"
     try:
-        logger.info(f"Transcription worker started for {audio_path} with model {model_name}")
-        progress_queue.put((0.0, "Loading model..."))
+        logger.info(f"Transcription job {job_id} started for {audio_path} with model {model_name}")
+        progress_queue.put((job_id, 0.0, "Loading model..."))
+        
+        if not (USE_FASTER_WHISPER or WHISPER_AVAILABLE):
+            raise RuntimeError("Whisper library is not available.")
         
         # Determine device
-        if device == "auto":
-            device = "cuda" if torch.cuda.is_available() else "cpu"
+        device = _resolve_device(device)
         logger.info(f"Using device: {device}")
         
         # Load the Whisper model
         model = _load_whisper_model(model_name, device)
-        progress_queue.put((0.1, "Model loaded successfully"))
+        progress_queue.put((job_id, 0.1, "Model loaded successfully"))
         
         if stop_event.is_set():
-            result_queue.put((None, "Transcription cancelled before processing"))
+            _send_result(progress_queue, result_queue, job_id, None, "Transcription cancelled before processing")
             return
         
         # Load audio file
-        progress_queue.put((0.2, "Loading audio..."))
+        progress_queue.put((job_id, 0.2, "Loading audio..."))
         try:
-            audio = whisper.load_audio(audio_path)
-            audio = whisper.pad_or_trim(audio)
-            progress_queue.put((0.3, "Audio loaded successfully"))
+            audio = _load_audio(audio_path)
+            progress_queue.put((job_id, 0.3, "Audio loaded successfully"))
         except Exception as e:
             error_msg = f"Failed to load audio file: {e}"
             logger.error(error_msg)
-            result_queue.put((None, error_msg))
+            _send_result(progress_queue, result_queue, job_id, None, error_msg)
             return
         
         if stop_event.is_set():
-            result_queue.put((None, "Transcription cancelled after loading audio"))
+            _send_result(progress_queue, result_queue, job_id, None, "Transcription cancelled after loading audio")
             return
         
         # Process audio with Whisper
-        progress_queue.put((0.4, "Transcribing..."))
+        progress_queue.put((job_id, 0.4, "Transcribing..."))
         
         # Prepare transcription options
         options = {}
@@ -246,35 +426,339 @@ def _transcribe_worker()
         
         # Perform transcription
         try:
-            result = model.transcribe()
-                audio, 
-                **options
-            )
-            progress_queue.put((0.9, "Transcription complete, processing results..."))
+            if USE_FASTER_WHISPER:
+                result = _transcribe_faster_whisper(model, audio, options)
+            else:
+                result = model.transcribe(
+                    audio, 
+                    fp16=(device == "cuda"),
+                    **options
+                )
+            progress_queue.put((job_id, 0.9, "Transcription complete, processing results..."))
         except Exception as e:
             error_msg = f"Transcription failed: {e}"
             logger.error(error_msg, exc_info=True)
-            result_queue.put((None, error_msg))
+            _send_result(progress_queue, result_queue, job_id, None, error_msg)
             return
         
         if stop_event.is_set():
-            result_queue.put((None, "Transcription cancelled after processing"))
+            _send_result(progress_queue, result_queue, job_id, None, "Transcription cancelled after processing")
             return
         
         # Send success result
-        progress_queue.put((1.0, "Transcription complete"))
-        result_queue.put((result, None))
-        logger.info(f"Transcription worker completed for {audio_path}")
+        progress_queue.put((job_id, 1.0, "Transcription complete"))
+        _send_result(progress_queue, result_queue, job_id, result, None)
+        logger.info(f"Transcription job {job_id} completed for {audio_path}")
         
     except Exception as e:
         error_msg = f"Unexpected error in transcription worker: {e}"
         logger.error(error_msg, exc_info=True)
-        result_queue.put((None, error_msg))
+        _send_result(progress_queue, result_queue, job_id, None, error_msg)
+
+
+class _JobStopFlag:
+    """Stop flag of one job, set once the controller asks to cancel that job ID."""
+    
+    def __init__(self, cancel_job_id, job_id: int):
+        self._cancel_job_id = cancel_job_id
+        self._job_id = job_id
+    
+    def is_set(self) -> bool:
+        """Check whether cancellation was requested for this job."""
+        return self._cancel_job_id.value == self._job_id
+
+
+def _worker_main(
+    model_name: str,
+    device: str,
+    job_queue: Queue,
+    result_queue: Queue,
+    progress_queue: Queue,
+    cancel_job_id
+):
+    """"
+    Main loop of a pool worker process.
+    
+    The worker serves jobs for a single model and device, so the model is
+    loaded by the first job and stays cached for all later ones.
+    
+    Args:
+        model_name: Name of the Whisper model to use.
+        device: Device to run the model on ('cpu' or 'cuda').
+        job_queue: Queue of (job_id, audio_path, language) jobs; None stops the worker.
+        result_queue: Queue to put the results into.
+        progress_queue: Queue to report progress.
+        cancel_job_id: Shared value holding the ID of the job to cancel; requests
+            for any other job are ignored.
+    """"
+    logger.info(f"Transcription worker started for model {model_name} on {device}")
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+        
+        job_id, audio_path, language = job
+        # Cancellation requests only apply to the job they were made for
+        stop_flag = _JobStopFlag(cancel_job_id, job_id)
+        _transcribe_worker(job_id, audio_path, model_name, device, result_queue, progress_queue, stop_flag, language)
+    logger.info(f"Transcription worker for model {model_name} on {device} stopped")
+
+
+# ===== Worker Pool =====
+
+class _Job:
+    """A transcription job and the futures that report its progress to the caller."""
+    
+    def __init__(self, job_id: int, audio_path: str, model_name: str, device: str,
+                 language: Optional[str], progress_callback: Optional[Callable[[float, str], None]]):
+        self.job_id = job_id
+        self.audio_path = audio_path
+        self.key = (model_name, device)
+        self.language = language
+        self.progress_callback = progress_callback
+        self.worker: Optional["_PoolWorker"] = None
+        # Resolved when the worker picks the job up, and with (result, error) when it finishes
+        self.started: Future = Future()
+        self.done: Future = Future()
+
+
+class _PoolWorker:
+    """"
+    A worker process together with the queues and events used to talk to it.
+    
+    A dispatcher thread routes the worker's progress updates and results to
+    the futures of the submitted jobs, so no caller has to poll the queues.
+    """"
+    
+    def __init__(self, model_name: str, device: str):
+        self.key = (model_name, device)
+        self.job_queue = _mp_context.Queue()
+        self.result_queue = _mp_context.Queue()
+        self.progress_queue = _mp_context.Queue()
+        self.cancel_job_id = _mp_context.Value("q", 0)
+        self.jobs: Dict[int, _Job] = {}
+        self.closed = False
+        self.served_jobs = False
+        self.lock = threading.Lock()
+        self.process = _mp_context.Process(
+            target=_worker_main,
+            args=(model_name, device, self.job_queue, self.result_queue, self.progress_queue, self.cancel_job_id),
+            name=f"transcribe-{model_name}-{device}",
+            daemon=True
+        )
+        self.dispatcher = threading.Thread(target=self._dispatch, name=f"transcribe-dispatch-{model_name}-{device}", daemon=True)
+    
+    def start(self):
+        """Start the worker process and its dispatcher thread."""
+        self.process.start()
+        self.dispatcher.start()
+    
+    def submit(self, job: _Job) -> bool:
+        """"
+        Queue a job on this worker.
+        
+        Args:
+            job: The job to run.
+            
+        Returns:
+            False if the worker has already exited, True otherwise.
+        """"
+        with self.lock:
+            if self.closed:
+                return False
+            self.jobs[job.job_id] = job
+            job.worker = self
+        self.job_queue.put((job.job_id, job.audio_path, job.language))
+        return True
+    
+    def cancel(self, job: _Job):
+        """Ask the worker process to stop a job; ignored once another job runs."""
+        self.cancel_job_id.value = job.job_id
+    
+    def forget(self, job: _Job):
+        """Stop tracking a job, e.g. after its caller gave up on it."""
+        with self.lock:
+            self.jobs.pop(job.job_id, None)
+    
+    def _dispatch(self):
+        """Route messages from the worker process until it exits."""
+        # Block on the progress pipe and the process sentinel together, so a
+        # crashed worker is noticed as soon as it exits
+        progress_reader = self.progress_queue._reader
+        while True:
+            ready = multiprocessing.connection.wait([progress_reader, self.process.sentinel])
+            self._drain_messages()
+            if self.process.sentinel in ready:
+                break
+        
+        # Handle messages sent right before the process exited
+        self._drain_messages()
+        
+        with self.lock:
+            self.closed = True
+            jobs = list(self.jobs.values())
+            self.jobs.clear()
+        
+        _unregister_process(self.process)
+        
+        # Jobs that never started are handed to a fresh worker, unless this
+        # worker never managed to start any job at all
+        for job in jobs:
+            if self.served_jobs and not job.started.done():
+                _worker_pool.submit(job)
+            else:
+                job.done.set_result((None, "Transcription process terminated unexpectedly"))
+    
+    def _drain_messages(self):
+        """Handle all messages currently waiting on the progress queue."""
+        while True:
+            try:
+                message = self.progress_queue.get(block=False)
+            except queue.Empty:
+                return
+            self._handle_message(*message)
+    
+    def _handle_message(self, job_id: int, progress: float, status_text: Optional[str]):
+        """Deliver one progress message, or the job's result on the completion sentinel."""
+        self.served_jobs = True
+        if status_text is None:
+            # Results follow their sentinel on the result queue
+            try:
+                job_id, result, error = self.result_queue.get(timeout=RESULT_WAIT_TIMEOUT)
+            except queue.Empty:
+                result, error = None, "Transcription result was not received"
+            with self.lock:
+                job = self.jobs.pop(job_id, None)
+            if job is not None:
+                if not job.started.done():
+                    job.started.set_result(None)
+                job.done.set_result((result, error))
+            return
+        
+        with self.lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            return
+        if not job.started.done():
+            job.started.set_result(None)
+        if job.progress_callback:
+            try:
+                job.progress_callback(progress, status_text)
+            except Exception as e:
+                logger.error(f"Error handling progress update: {e}")
+
+
+class TranscriptionWorkerPool:
+    """"
+    Long-lived transcription worker processes keyed by model and device.
+    
+    Reusing a worker keeps its Whisper model loaded, so only the first job
+    for a model pays the import and model loading cost.
+    """"
+    
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._workers: Dict[Tuple[str, str], _PoolWorker] = {}
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+    
+    def create_job(self, audio_path: str, model_name: str, device: str, language: Optional[str] = None,
+                   progress_callback: Optional[Callable[[float, str], None]] = None) -> _Job:
+        """"
+        Create and submit a transcription job.
+        
+        Args:
+            audio_path: Path to the audio file to transcribe.
+            model_name: Name of the Whisper model.
+            device: Device to run the model on.
+            language: Optional language code for transcription.
+            progress_callback: Called from the dispatcher thread with progress updates.
+            
+        Returns:
+            The submitted job.
+        """"
+        job = _Job(next(self._job_ids), audio_path, model_name, device, language, progress_callback)
+        self.submit(job)
+        return job
+    
+    def submit(self, job: _Job):
+        """"
+        Submit a job to the worker for its model and device.
+        
+        Args:
+            job: The job to run.
+        """"
+        while not self.get_worker(*job.key).submit(job):
+            pass  # The worker exited in the meantime; get_worker starts a new one
+        logger.info(f"Submitted transcription job {job.job_id} for {job.audio_path} to worker (PID: {job.worker.process.pid})")
+    
+    def get_worker(self, model_name: str, device: str) -> _PoolWorker:
+        """"
+        Get the worker for a model and device, starting it if needed.
+        
+        Args:
+            model_name: Name of the Whisper model.
+            device: Device to run the model on.
+            
+        Returns:
+            A running pool worker.
+        """"
+        key = (model_name, device)
+        with self._lock:
+            worker = self._workers.get(key)
+            if worker is None or worker.closed or not worker.process.is_alive():
+                worker = _PoolWorker(model_name, device)
+                worker.start()
+                _register_process(worker.process)
+                self._workers[key] = worker
+                logger.info(f"Started transcription worker (PID: {worker.process.pid}) for model {model_name} on {device}")
+            return worker
+    
+    def discard(self, worker: _PoolWorker):
+        """"
+        Terminate a worker and remove it from the pool.
+        
+        Jobs still queued on the worker are moved to a new one.
+        
+        Args:
+            worker: The worker to discard.
+        """"
+        with self._lock:
+            if self._workers.get(worker.key) is worker:
+                del self._workers[worker.key]
+        
+        process = worker.process
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout=1.0)
+            if process.is_alive():
+                logger.warning(f"Forcibly killing transcription process {process.pid}")
+                process.kill()
+        _unregister_process(process)
+    
+    def shutdown(self, timeout: float = 5.0):
+        """"
+        Stop all workers, letting them finish their queued jobs.
+        
+        Args:
+            timeout: Seconds to wait for each worker before terminating it.
+        """"
+        with self._lock:
+            workers = list(self._workers.values())
+        
+        for worker in workers:
+            worker.job_queue.put(None)
+        for worker in workers:
+            worker.process.join(timeout=timeout)
+            self.discard(worker)
+
+
+_worker_pool = TranscriptionWorkerPool()
 
 
 # ===== Main Transcription Function =====
 
-def transcribe()
+async def transcribe_async(
     audio_path: str,
     model_name: str = 'small',
     language: Optional[str] = None,
@@ -283,124 +767,117 @@ def transcribe()
     timeout: Optional[float] = DEFAULT_TRANSCRIPTION_TIMEOUT
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """"
-    Transcribe an audio file using a Whisper model in a separate process.
+    Transcribe an audio file using a Whisper model in a pool worker process.
+    
+    The coroutine only waits on futures resolved by the pool's dispatcher
+    thread, so one event loop can supervise many jobs at once.
     
     Args:
         audio_path: Path to the input audio file.
         model_name: The name of the Whisper model to use.
         language: Optional source language code.
-        progress_callback: Optional callback function for progress updates.
+        progress_callback: Optional callback function for progress updates, called on the event loop.
         stop_event: Optional Event to signal cancellation.
-        timeout: Maximum time in seconds to wait for transcription.
+        timeout: Maximum time in seconds the transcription may run once the worker starts it.
         
     Returns:
         A tuple containing:
         - The transcription result dictionary if successful, None otherwise.
         - An error message string if failed, None otherwise.
     """"
-    if not os.path.exists(audio_path):
+    if not os.path.isfile(audio_path):
         return None, f"Audio file not found: {audio_path}"
     
-    if model_name not in TRANSCRIPTION_MODELS:
+    if model_name not in _VALID_MODELS:
         return None, f"Invalid model name: {model_name}. Valid models are: {', '.join(TRANSCRIPTION_MODELS)}"
     
-    # Create our own stop_event if none provided
-    internal_stop_event = None
-    if stop_event is None:
-        internal_stop_event = Event()
-        stop_event = internal_stop_event
-    
-    # Determine device for transcription
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    
-    # Create queues for communication
-    result_queue = Queue()
-    progress_queue = Queue()
-    
-    # Create and start the worker process
-    worker = Process()
-        target=_transcribe_worker,
-        args=(audio_path, model_name, device, result_queue, progress_queue, stop_event, language),
-        name=f"transcribe-{os.path.basename(audio_path)}"
-    )
-    
-    # Register the process for cleanup
-    _register_process(worker)
+    loop = asyncio.get_running_loop()
+    callback = None
+    if progress_callback:
+        callback = lambda progress, status_text: loop.call_soon_threadsafe(progress_callback, progress, status_text)
     
+    job = None
     try:
-        worker.start()
-        logger.info(f"Started transcription process (PID: {worker.pid}) for {audio_path}")
-        
-        start_time = time.time()
-        result = None
-        error = None
-        completed = False
-        
-        # Monitor progress and check for completion
-        while not completed and (timeout is None or time.time() - start_time < timeout):
-            if worker.is_alive():
-                # Check for progress updates
-                try:
-                    while not progress_queue.empty():
-                        progress, status_text = progress_queue.get(block=False)
-                        if progress_callback:
-                            progress_callback(progress, status_text)
-                except Exception as e:
-                    logger.error(f"Error handling progress update: {e}")
-                
-                # Check for results
-                try:
-                    if not result_queue.empty():
-                        result, error = result_queue.get(block=False)
-                        completed = True
-                except Exception as e:
-                    logger.error(f"Error checking for results: {e}")
-                
-                # Small delay to prevent busy waiting
-                time.sleep(0.1)
-            else:
-                # Process ended
-                if not result_queue.empty():
-                    try:
-                        result, error = result_queue.get(block=False)
-                        completed = True
-                    except Exception as e:
-                        logger.error(f"Error retrieving results after process ended: {e}")
-                else:
-                    error = "Transcription process terminated unexpectedly"
-                    completed = True
+        # The worker resolves the device, so torch is never imported in this process
+        job = _worker_pool.create_job(audio_path, model_name, "auto", language, callback)
+        started = asyncio.wrap_future(job.started)
+        done = asyncio.wrap_future(job.done)
+        deadline = None
         
-        # Handle timeout
-        if not completed:
-            logger.warning(f"Transcription timeout after {timeout} seconds")
-            stop_event.set()
-            error = f"Transcription timeout after {timeout} seconds"
-            
-            # Give the process a moment to clean up after stop signal
-            time.sleep(0.5)
+        while not done.done():
+            if job.started.done():
+                if deadline is None and timeout is not None:
+                    deadline = loop.time() + timeout
+                if stop_event is not None and stop_event.is_set():
+                    job.worker.cancel(job)
             
-            if worker.is_alive():
-                logger.warning(f"Terminating transcription process after timeout")
-                worker.terminate()
-                worker.join(timeout=1.0)
-                if worker.is_alive():
-                    logger.warning(f"Forcibly killing transcription process")
-                    worker.kill()
+            # Wake up periodically to pass on stop requests
+            wait = STOP_CHECK_INTERVAL
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                wait = min(wait, remaining)
+            await asyncio.wait({done} if started.done() else {started, done}, timeout=wait,
+                               return_when=asyncio.FIRST_COMPLETED)
         
-        # Unregister process from tracking
-        _unregister_process(worker)
+        if done.done():
+            return done.result()
         
-        return result, error
+        # Handle timeout
+        logger.warning(f"Transcription timeout after {timeout} seconds")
+        worker = job.worker
+        worker.forget(job)
+        worker.cancel(job)
+        
+        # The model cannot be interrupted mid-run, so the worker is replaced
+        logger.warning(f"Terminating transcription process after timeout")
+        _worker_pool.discard(worker)
+        return None, f"Transcription timeout after {timeout} seconds"
     
     except Exception as e:
         logger.error(f"Error in transcription controller: {e}", exc_info=True)
         
         # Ensure process is terminated
-        if worker.is_alive():
-            worker.terminate()
-            worker.join(timeout=1.0)
-        
-        # Unregister process from tracking
-        _unregister_process(worker)
+        if job is not None and job.worker is not None:
+            job.worker.forget(job)
+            _worker_pool.discard(job.worker)
         
         return None, f"Transcription failed: {e}"
+
+
+def transcribe(
+    audio_path: str,
+    model_name: str = 'small',
+    language: Optional[str] = None,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    stop_event: Optional[Event] = None,
+    timeout: Optional[float] = DEFAULT_TRANSCRIPTION_TIMEOUT
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """"
+    Transcribe an audio file using a Whisper model in a pool worker process.
+    
+    Synchronous wrapper around transcribe_async; it must not be called from
+    a thread that is already running an event loop.
+    
+    Args:
+        audio_path: Path to the input audio file.
+        model_name: The name of the Whisper model to use.
+        language: Optional source language code.
+        progress_callback: Optional callback function for progress updates.
+        stop_event: Optional Event to signal cancellation.
+        timeout: Maximum time in seconds the transcription may run once the worker starts it.
+        
+    Returns:
+        A tuple containing:
+        - The transcription result dictionary if successful, None otherwise.
+        - An error message string if failed, None otherwise.
+    """"
+    return asyncio.run(transcribe_async(
+        audio_path,
+        model_name=model_name,
+        language=language,
+        progress_callback=progress_callback,
+        stop_event=stop_event,
+        timeout=timeout
+    ))
@@ -3,18 +3,206 @@ Translation service for YouTube Translator Pro.
 Handles the translation of transcription results into different languages.
 """"
 
+import os
+import re
 import time
+import asyncio
 import logging
 import threading
-from typing import Dict, List, Any, Optional, Tuple, Callable
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterator, Awaitable
 from enum import Enum, auto
 
+import requests
+
 # Import configuration
-from src.config import TRANSLATION_LANGUAGES, DEFAULT_TRANSLATION_TIMEOUT
+from src.config import (
+    TRANSLATION_LANGUAGES, DEFAULT_TRANSLATION_TIMEOUT, TRANSLATION_PACK_SIZE, TRANSLATION_CACHE_TTL_DAYS
+)
+from src.utils.translation_cache import TranslationCache
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# aiohttp is optional; it is only imported when a translation runs asynchronously
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+
+# Batching settings
+BATCH_SIZE = 50  # Segments sent to the translator per request
+DEEPL_MAX_BATCH_TEXTS = 50  # Texts DeepL accepts in one request
+DEEPL_MAX_REQUEST_BYTES = 76 * 1024  # Keep DeepL request bodies well below the API limit
+
+# ISO 639-1 codes mapped to DeepL target language codes
+_DEEPL_LANG_MAP = {
+    "ar": "AR", "bg": "BG", "cs": "CS", "da": "DA", "de": "DE", "el": "EL",
+    "en": "EN-US",  # Default to US English
+    "es": "ES", "et": "ET", "fi": "FI", "fr": "FR", "hu": "HU", "id": "ID",
+    "it": "IT", "ja": "JA", "ko": "KO", "lt": "LT", "lv": "LV",
+    "nb": "NB", "no": "NB",  # DeepL only offers Norwegian Bokmål
+    "nl": "NL", "pl": "PL",
+    "pt": "PT-BR",  # Default to Brazilian Portuguese
+    "ro": "RO", "ru": "RU", "sk": "SK", "sl": "SL", "sv": "SV", "tr": "TR",
+    "uk": "UK", "zh": "ZH",
+}
+
+DEFAULT_MAX_CONCURRENCY = 8  # Batches translated in parallel
+STOP_CHECK_INTERVAL = 0.1  # Seconds between stop/timeout checks while batches run
+
+# Marker joining packed segments; matched loosely since engines may alter its spacing or case
+SEGMENT_DELIMITER = "\n<<<SEG>>>\n"
+_SEGMENT_SPLIT = re.compile(r"\s*<<<\s*SEG\s*>>>\s*", re.IGNORECASE)
+
+# REST endpoints used by the asynchronous translators
+GOOGLE_TRANSLATE_URL = "https://translation.googleapis.com/language/translate/v2"
+DEEPL_API_URL = "https://api.deepl.com/v2/translate"
+DEEPL_FREE_API_URL = "https://api-free.deepl.com/v2/translate"
+
+# Retry settings for transient API failures (timeouts, rate limits, 5xx responses)
+TRANSLATION_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # Seconds before the first retry, doubled on every attempt
+RETRY_MAX_DELAY = 30.0
+RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_TRANSIENT_ERRORS = (TimeoutError, ConnectionError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+# Maximum number of translations kept in memory for repeated texts
+TRANSLATION_MEMO_SIZE = 10_000
+
+# On-disk translation cache shared by all translators, opened on first use
+_translation_cache = None
+_translation_cache_lock = threading.Lock()
+
+
+def _get_translation_cache() -> Optional[TranslationCache]:
+    """"
+    Get the shared on-disk translation cache.
+    
+    Returns:
+        The cache, or None if it could not be opened
+    """"
+    global _translation_cache
+    with _translation_cache_lock:
+        if _translation_cache is None:
+            try:
+                    _translation_cache = TranslationCache(ttl_days=TRANSLATION_CACHE_TTL_DAYS)
+            except Exception as e:
+                logger.warning(f"Translation cache unavailable, continuing without it: {e}")
+                _translation_cache = False
+        return _translation_cache or None
+
+
+def _is_transient(error: Exception, transient_errors: tuple = ()) -> bool:
+    """"
+    Check whether a failed API call is worth retrying.
+    
+    Args:
+        error: The exception raised by the call
+        transient_errors: Engine-specific exception types that are always transient
+        
+    Returns:
+        True for timeouts, connection errors and retriable HTTP status codes
+    """"
+    if isinstance(error, _TRANSIENT_ERRORS + transient_errors):
+        return True
+    
+    # HTTP errors carry their status under different names depending on the library
+    for attr in ("status", "code", "http_status_code", "status_code"):
+        status = getattr(error, attr, None)
+        if isinstance(status, int):
+            return status in RETRIABLE_STATUS_CODES
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) in RETRIABLE_STATUS_CODES
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """"
+    Get the time to wait before retrying a failed API call.
+    
+    Args:
+        error: The exception raised by the call
+        attempt: Number of the failed attempt, starting at 0
+        
+    Returns:
+        The Retry-After header value when the response has one, otherwise exponential backoff
+    """"
+    headers = getattr(error, "headers", None) or getattr(getattr(error, "response", None), "headers", None)
+    try:
+            return min(float(headers["Retry-After"]), RETRY_MAX_DELAY)
+    except (TypeError, KeyError, ValueError):
+        return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+
+
+def _call_with_retry(
+    call: Callable[[], Any],
+    stop_event: Optional[threading.Event] = None,
+    transient_errors: tuple = ()
+) -> Any:
+    """"
+    Call a translation API, retrying transient failures with exponential backoff.
+    
+    Args:
+        call: Function performing the API request
+        stop_event: Optional event to signal cancellation; ends the wait between attempts
+        transient_errors: Engine-specific exception types that are always transient
+        
+    Returns:
+        The result of call
+    
+    Raises:
+        The last exception if the call did not succeed
+    """"
+    for attempt in range(TRANSLATION_MAX_ATTEMPTS):
+        try:
+                return call()
+        except Exception as e:
+            if attempt == TRANSLATION_MAX_ATTEMPTS - 1 or not _is_transient(e, transient_errors):
+                raise
+            
+            delay = _retry_delay(e, attempt)
+            logger.warning(f"Transient translation API error, retrying in {delay:.1f}s: {e}")
+            if stop_event is None:
+                time.sleep(delay)
+            elif stop_event.wait(delay):
+                raise
+
+
+async def _call_with_retry_async(call: Callable[[], Awaitable[Any]], transient_errors: tuple = ()) -> Any:
+    """Asynchronous version of _call_with_retry; cancel the task to stop retrying."""
+    for attempt in range(TRANSLATION_MAX_ATTEMPTS):
+        try:
+                return await call()
+        except Exception as e:
+            if attempt == TRANSLATION_MAX_ATTEMPTS - 1 or not _is_transient(e, transient_errors):
+                raise
+            
+            delay = _retry_delay(e, attempt)
+            logger.warning(f"Transient translation API error, retrying in {delay:.1f}s: {e}")
+            await asyncio.sleep(delay)
+
+
+async def _post_json(session, url: str, **kwargs) -> Any:
+    """"
+    POST a request with aiohttp and decode the JSON response, retrying transient failures.
+    
+    Args:
+        session: The aiohttp.ClientSession to send the request with
+        url: The URL to post to
+        **kwargs: Options passed to session.post
+        
+    Returns:
+        The decoded JSON response
+    """"
+    import aiohttp
+    
+    async def post():
+        async with session.post(url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json()
+    
+    return await _call_with_retry_async(post, (aiohttp.ClientConnectionError,))
+
+
 class TranslationEngine(Enum):
     """Available translation engines."""
     MOCK = auto()       # Mock engine for testing/development
@@ -29,16 +217,19 @@ class TranslationService:
     Supports multiple translation engines and provides a unified interface.
     """"
     
-    def __init__(self, engine: TranslationEngine = TranslationEngine.MOCK, api_key: Optional[str] = None):
+    def __init__(self, engine: TranslationEngine = TranslationEngine.MOCK, api_key: Optional[str] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         """"
         Initialize the translation service.
         
         Args:
             engine: The translation engine to use
             api_key: Optional API key for the selected engine
+            max_concurrency: Maximum number of translator requests in flight (DeepL recommends at most 10)
         """"
         self.engine = engine
         self.api_key = api_key
+        self.max_concurrency = max(1, max_concurrency)
         self._initialize_engine()
         logger.info(f"Translation service initialized with {engine.name} engine")
     
@@ -65,7 +256,7 @@ class TranslationService:
         """"
         return TRANSLATION_LANGUAGES.copy()
     
-    def translate()
+    def translate(
         self,
         transcription_result: Dict[str, Any],
         target_language: str,
@@ -119,61 +310,64 @@ class TranslationService:
         if progress_callback:
             progress_callback(0.0, f"Starting translation to {TRANSLATION_LANGUAGES[target_language]}")
         
-        # Process each segment
-        translated_segments = []
+        # Translate the batches concurrently, one translator request per batch
+        batches = {
+            start: segments[start:start + BATCH_SIZE]
+            for start in range(0, total_segments, BATCH_SIZE)
+        }
+        translated_batches = {}
         error_message = None
+        completed_segments = 0
+        last_percentage = 0
         
-        for i, segment in enumerate(segments):
-            # Check for stop event or timeout
-            if stop_event.is_set():
-                return None, "Translation cancelled."
-            
-            if timeout and (time.time() - start_time > timeout):
-                return None, f"Translation timeout after {timeout} seconds."
+        def on_batch_done(start: int, batch_segments: List[Dict[str, Any]], error: Optional[str]):
+            nonlocal error_message, completed_segments, last_percentage
+            translated_batches[start] = batch_segments
+            if error:
+                error_message = error
             
-            # Report progress
-            progress = i / total_segments
-            if progress_callback:
-                progress_callback(progress, f"Translating segment {i+1}/{total_segments}")
-            
-            try:
-                    # Extract text to translate
-                text = segment.get("text", "")
-                
-                # Translate the text
-                translated_text, error = self.translator.translate_text()
-                    text, 
-                    target_language,
-                    stop_event=stop_event
+            # Report progress, only when the whole percentage changes
+            completed_segments += len(batch_segments)
+            percentage = completed_segments * 100 // total_segments
+            if progress_callback and percentage != last_percentage:
+                last_percentage = percentage
+                progress_callback(
+                    percentage / 100,
+                    f"Translated {completed_segments}/{total_segments} segments"
                 )
-                
-                if error:
-                    logger.warning(f"Error translating segment {i}: {error}")
-                    error_message = f"Error translating segment {i}: {error}"
-                    # Continue with next segment
-                
-                # Create a new segment with translated text
-                translated_segment = segment.copy()
-                translated_segment["text"] = translated_text or text  # Fall back to original if translation failed
-                translated_segments.append(translated_segment)
-                
-            except Exception as e:
-                logger.error(f"Exception translating segment {i}: {e}")
-                # Create a copy with original text as fallback
-                translated_segment = segment.copy()
-                translated_segments.append(translated_segment)
-                error_message = f"Error during translation: {e}"
-        
-        # Create the translated result
-        translated_result = transcription_result.copy()
-        translated_result["segments"] = translated_segments
-        
-        # Add metadata about translation
-        if "metadata" not in translated_result:
-            translated_result["metadata"] = {}
-        translated_result["metadata"]["translated"] = True
-        translated_result["metadata"]["target_language"] = target_language
-        translated_result["metadata"]["translation_engine"] = self.engine.name
+        
+        deadline = start_time + timeout if timeout else None
+        if self.translator.supports_async:
+            abort_message = asyncio.run(
+                self._run_batches_async(batches, target_language, stop_event, deadline, on_batch_done)
+            )
+        else:
+            abort_message = self._run_batches_threaded(
+                batches, target_language, stop_event, deadline, on_batch_done
+            )
+        
+        if abort_message == "timeout":
+            return None, f"Translation timeout after {timeout} seconds."
+        if abort_message:
+            return None, abort_message
+        
+        translated_segments = [
+            segment
+            for start in sorted(translated_batches)
+            for segment in translated_batches[start]
+        ]
+        
+        # Create the translated result with metadata about translation
+        translated_result = {
+            **transcription_result,
+            "segments": translated_segments,
+            "metadata": {
+                **transcription_result.get("metadata", {}),
+                "translated": True,
+                "target_language": target_language,
+                "translation_engine": self.engine.name
+            }
+        }
         
         # Report completion
         if progress_callback:
@@ -182,6 +376,209 @@ class TranslationService:
         logger.info(f"Translation to {target_language} completed in {time.time() - start_time:.2f} seconds")
         
         return translated_result, error_message
+    
+    def _run_batches_threaded(
+        self,
+        batches: Dict[int, List[Dict[str, Any]]],
+        target_language: str,
+        stop_event: threading.Event,
+        deadline: Optional[float],
+        on_batch_done: Callable[[int, List[Dict[str, Any]], Optional[str]], None]
+    ) -> Optional[str]:
+        """"
+        Translate batches in a thread pool of max_concurrency workers.
+        
+        Args:
+            batches: The batches to translate, keyed by the index of their first segment
+            target_language: The target language code
+            stop_event: Event to signal cancellation
+            deadline: time.time() value after which translation times out, or None
+            on_batch_done: Called with the start index, translated segments and error of each finished batch
+            
+        Returns:
+            None if all batches finished, "timeout" on timeout, or the cancellation message
+        """"
+        # Stops the batches still running once translation is cancelled or times out
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            futures = {
+                executor.submit(self._translate_batch, batch, start, target_language, cancel_event): start
+                for start, batch in batches.items()
+            }
+            pending = set(futures)
+            
+            while pending:
+                abort_message, wait_time = _check_abort(stop_event, deadline)
+                if abort_message:
+                    cancel_event.set()
+                    return abort_message
+                
+                done, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+                for future in done:
+                    on_batch_done(futures[future], *future.result())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return None
+    
+    async def _run_batches_async(
+        self,
+        batches: Dict[int, List[Dict[str, Any]]],
+        target_language: str,
+        stop_event: threading.Event,
+        deadline: Optional[float],
+        on_batch_done: Callable[[int, List[Dict[str, Any]], Optional[str]], None]
+    ) -> Optional[str]:
+        """"
+        Translate batches on one event loop with at most max_concurrency requests in flight.
+        
+        Takes the same arguments and returns the same values as _run_batches_threaded.
+        """"
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with aiohttp.ClientSession() as session:
+            tasks = {
+                asyncio.ensure_future(
+                    self._translate_batch_async(session, semaphore, batch, start, target_language)
+                ): start
+                for start, batch in batches.items()
+            }
+            pending = set(tasks)
+            try:
+                while pending:
+                    abort_message, wait_time = _check_abort(stop_event, deadline)
+                    if abort_message:
+                        return abort_message
+                    
+                    done, pending = await asyncio.wait(pending, timeout=wait_time, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        on_batch_done(tasks[task], *task.result())
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        return None
+    
+    def _translate_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        start: int,
+        target_language: str,
+        stop_event: threading.Event
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """"
+        Translate one batch of segments.
+        
+        Args:
+            batch: The segments to translate
+            start: Index of the first segment of the batch, used in messages
+            target_language: The target language code
+            stop_event: Event to signal cancellation
+            
+        Returns:
+            A tuple containing:
+            - The translated segments, keeping the original text where translation failed
+            - An error message string if any segment failed, None otherwise
+        """"
+        texts = [segment.get("text", "") for segment in batch]
+        
+        try:
+                # Translate the batch
+            translated_texts, error = self.translator.translate_cached(
+                texts,
+                target_language,
+                stop_event=stop_event
+            )
+        except Exception as e:
+            return self._failed_batch(batch, start, e)
+        
+        if stop_event.is_set():
+            error = None  # Cancelled batches are discarded, no need to report them
+        return self._apply_translations(batch, start, texts, translated_texts, error)
+    
+    async def _translate_batch_async(
+        self,
+        session,
+        semaphore: asyncio.Semaphore,
+        batch: List[Dict[str, Any]],
+        start: int,
+        target_language: str
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Asynchronous version of _translate_batch; requests wait for a semaphore slot."""
+        texts = [segment.get("text", "") for segment in batch]
+        
+        try:
+            async with semaphore:
+                translated_texts, error = await self.translator.translate_cached_async(
+                    session,
+                    texts,
+                    target_language
+                )
+        except Exception as e:
+            return self._failed_batch(batch, start, e)
+        
+        return self._apply_translations(batch, start, texts, translated_texts, error)
+    
+    @staticmethod
+    def _apply_translations(
+        batch: List[Dict[str, Any]],
+        start: int,
+        texts: List[str],
+        translated_texts: List[Optional[str]],
+        error: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Create the translated segments of a batch, keeping the original text where translation failed."""
+        error_message = None
+        if error:
+            end = start + len(batch)
+            logger.warning(f"Error translating segments {start}-{end-1}: {error}")
+            error_message = f"Error translating segments {start}-{end-1}: {error}"
+        
+        # Create new segments with translated text, falling back to the original if translation failed
+        translated_segments = [
+            {**segment, "text": translated_text or text}
+            for segment, text, translated_text in zip(batch, texts, translated_texts)
+        ]
+        
+        return translated_segments, error_message
+    
+    @staticmethod
+    def _failed_batch(
+        batch: List[Dict[str, Any]],
+        start: int,
+        exception: Exception
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Keep the original segments of a batch whose translation raised an exception."""
+        logger.error(f"Exception translating segments {start}-{start + len(batch) - 1}: {exception}")
+        return [segment.copy() for segment in batch], f"Error during translation: {exception}"
+
+
+def _check_abort(stop_event: threading.Event, deadline: Optional[float]) -> Tuple[Optional[str], float]:
+    """"
+    Check whether running batches should be abandoned.
+    
+    Args:
+        stop_event: Event to signal cancellation
+        deadline: time.time() value after which translation times out, or None
+        
+    Returns:
+        A tuple containing:
+        - "timeout" on timeout, the cancellation message if stopped, None otherwise
+        - How long to wait for batches before checking again
+    """"
+    if stop_event.is_set():
+        return "Translation cancelled.", 0.0
+    
+    wait_time = STOP_CHECK_INTERVAL
+    if deadline is not None:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return "timeout", 0.0
+        wait_time = min(wait_time, remaining)
+    return None, wait_time
 
 
 # ===== Translator Implementations =====
@@ -189,7 +586,20 @@ class TranslationService:
 class BaseTranslator:
     """Base translator interface."""
     
-    def translate_text()
+    # Translations shared by all translator instances, in LRU order
+    _memo: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+    _memo_lock = threading.Lock()
+    
+    # Whether translate_batch_async can be used instead of translate_batch
+    supports_async = False
+    
+    # Texts joined into one translate_text call by the default translate_batch
+    pack_size = TRANSLATION_PACK_SIZE
+    
+    # Whether translations are also kept in the on-disk translation cache
+    persistent_cache = True
+    
+    def translate_text(
         self, 
         text: str, 
         target_language: str,
@@ -209,12 +619,257 @@ class BaseTranslator:
             - An error message string if failed, None otherwise
         """"
         raise NotImplementedError("Subclasses must implement translate_text")
+    
+    def translate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        stop_event: Optional[threading.Event] = None
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """"
+        Translate several texts to the target language.
+        
+        The default implementation joins up to pack_size texts with
+        SEGMENT_DELIMITER into one translate_text call and splits the result,
+        translating the texts one by one if the parts don't line up. Engines
+        whose API accepts a list of texts override it to use one request.
+        
+        Args:
+            texts: The texts to translate
+            target_language: The target language code
+            stop_event: Optional event to signal cancellation
+            
+        Returns:
+            A tuple containing:
+            - The translated texts, with None for each text that failed
+            - An error message string if any text failed, None otherwise
+        """"
+        if self.pack_size <= 1:
+            return self._translate_each(texts, target_language, stop_event)
+        
+        translations = []
+        error = None
+        for start in range(0, len(texts), self.pack_size):
+            if stop_event and stop_event.is_set():
+                translations.extend([None] * (len(texts) - len(translations)))
+                return translations, "Translation cancelled."
+            
+            pack_translations, pack_error = self._translate_pack(
+                texts[start:start + self.pack_size], target_language, stop_event
+            )
+            translations.extend(pack_translations)
+            error = error or pack_error
+        return translations, error
+    
+    def _translate_pack(
+        self,
+        texts: List[str],
+        target_language: str,
+        stop_event: Optional[threading.Event]
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Translate texts joined into a single translate_text call."""
+        if len(texts) == 1 or any(_SEGMENT_SPLIT.search(text) for text in texts):
+            return self._translate_each(texts, target_language, stop_event)
+        
+        packed, error = self.translate_text(SEGMENT_DELIMITER.join(texts), target_language, stop_event=stop_event)
+        if packed is None:
+            return [None] * len(texts), error
+        
+        parts = _SEGMENT_SPLIT.split(packed.strip())
+        if len(parts) == len(texts):
+            return parts, None
+        
+        logger.debug(f"Packed translation returned {len(parts)} parts for {len(texts)} texts, translating them one by one")
+        return self._translate_each(texts, target_language, stop_event)
+    
+    def _translate_each(
+        self,
+        texts: List[str],
+        target_language: str,
+        stop_event: Optional[threading.Event]
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Translate texts with one translate_text call each."""
+        translations = []
+        error = None
+        for text in texts:
+            if stop_event and stop_event.is_set():
+                translations.extend([None] * (len(texts) - len(translations)))
+                return translations, "Translation cancelled."
+            
+            translated_text, text_error = self.translate_text(text, target_language, stop_event=stop_event)
+            translations.append(translated_text)
+            error = error or text_error
+        return translations, error
+    
+    def translate_cached(
+        self,
+        texts: List[str],
+        target_language: str,
+        stop_event: Optional[threading.Event] = None
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """"
+        Translate several texts, reusing earlier translations of the same text.
+        
+        Texts already translated by this engine are taken from a process-wide
+        LRU memo or the on-disk translation cache; only the remaining distinct
+        texts are passed to translate_batch. Empty and whitespace-only texts
+        are returned unchanged without a request.
+        
+        Args:
+            texts: The texts to translate
+            target_language: The target language code
+            stop_event: Optional event to signal cancellation
+            
+        Returns:
+            Same as translate_batch
+        """"
+        translated = self._memo_lookup(texts, target_language)
+        missing = list(dict.fromkeys(text for text in texts if text not in translated))
+        error = None
+        if missing:
+            results, error = self.translate_batch(missing, target_language, stop_event=stop_event)
+            translated.update(self._memo_store(missing, results, target_language))
+        
+        return [translated.get(text) for text in texts], error
+    
+    async def translate_batch_async(
+        self,
+        session,
+        texts: List[str],
+        target_language: str
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """"
+        Translate several texts without blocking the event loop.
+        
+        Only available when supports_async is True.
+        
+        Args:
+            session: The aiohttp.ClientSession to send requests with
+            texts: The texts to translate
+            target_language: The target language code
+            
+        Returns:
+            Same as translate_batch
+        """"
+        raise NotImplementedError("Translator does not support asynchronous translation")
+    
+    async def translate_cached_async(
+        self,
+        session,
+        texts: List[str],
+        target_language: str
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Asynchronous version of translate_cached, using translate_batch_async."""
+        # The cache lookups touch SQLite, so keep them off the event loop
+        translated = await asyncio.to_thread(self._memo_lookup, texts, target_language)
+        missing = list(dict.fromkeys(text for text in texts if text not in translated))
+        error = None
+        if missing:
+            results, error = await self.translate_batch_async(session, missing, target_language)
+            translated.update(await asyncio.to_thread(self._memo_store, missing, results, target_language))
+        
+        return [translated.get(text) for text in texts], error
+    
+    def _memo_lookup(self, texts: List[str], target_language: str) -> Dict[str, str]:
+        """Return the memoized or disk-cached translations of texts by this engine."""
+        engine = type(self).__name__
+        
+        # Empty and whitespace-only texts need no translation, they are kept as they are
+        translated = {text: text for text in texts if not text.strip()}
+        with self._memo_lock:
+            for text in texts:
+                if text in translated:
+                    continue
+                key = (engine, text, target_language)
+                if key in self._memo:
+                    self._memo.move_to_end(key)
+                    translated[text] = self._memo[key]
+        
+        cache = _get_translation_cache() if self.persistent_cache else None
+        missing = [text for text in texts if text not in translated]
+        if cache and missing:
+            try:
+                cached = cache.get_many(engine, target_language, missing)
+            except Exception as e:
+                logger.warning(f"Translation cache lookup failed: {e}")
+                cached = {}
+            
+            if cached:
+                translated.update(cached)
+                with self._memo_lock:
+                    for text, result in cached.items():
+                        self._memo[(engine, text, target_language)] = result
+        return translated
+    
+    def _memo_store(
+        self,
+        texts: List[str],
+        results: List[Optional[str]],
+        target_language: str
+    ) -> Dict[str, str]:
+        """Memoize and disk-cache the successful translations of texts and return them."""
+        engine = type(self).__name__
+        translated = {}
+        with self._memo_lock:
+            for text, result in zip(texts, results):
+                if result is None:
+                    continue
+                translated[text] = result
+                self._memo[(engine, text, target_language)] = result
+            while len(self._memo) > TRANSLATION_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        
+        cache = _get_translation_cache() if self.persistent_cache else None
+        if cache and translated:
+            try:
+                cache.put_many(engine, target_language, list(translated.items()))
+            except Exception as e:
+                logger.warning(f"Translation cache update failed: {e}")
+        return translated
+
+
+def _chunk_texts(texts: List[str], max_count: int, max_bytes: int) -> Iterator[List[str]]:
+    """"
+    Split texts into chunks limited by count and UTF-8 size.
+    
+    Args:
+        texts: The texts to split
+        max_count: Maximum number of texts per chunk
+        max_bytes: Maximum total UTF-8 size per chunk; a single larger text gets its own chunk
+        
+    Yields:
+        Lists of consecutive texts
+    """"
+    chunk = []
+    chunk_bytes = 0
+    for text in texts:
+        text_bytes = len(text.encode('utf-8'))
+        if chunk and (len(chunk) >= max_count or chunk_bytes + text_bytes > max_bytes):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(text)
+        chunk_bytes += text_bytes
+    if chunk:
+        yield chunk
 
 
 class MockTranslator(BaseTranslator):
     """Mock translator for testing and development."""
     
-    def translate_text()
+    # The language tag is added per call, so texts must not be packed together
+    pack_size = 1
+    
+    # Mock output is not worth persisting
+    persistent_cache = False
+    
+    # Simulated processing time per call, skipped when YTP_TEST_FAST is set
+    delay = 0.05
+    
+    # Language indicator appended to texts, per target language
+    _suffixes: Dict[str, str] = {}
+    
+    def translate_text(
         self, 
         text: str, 
         target_language: str,
@@ -226,13 +881,19 @@ class MockTranslator(BaseTranslator):
         if stop_event and stop_event.is_set():
             return None, "Translation cancelled."
         
-        # Simulate processing time
-        time.sleep(0.05)
+        # Simulate processing time, waking up early on cancellation
+        if not os.environ.get("YTP_TEST_FAST"):
+            if stop_event is None:
+                time.sleep(self.delay)
+            elif stop_event.wait(self.delay):
+                return None, "Translation cancelled."
         
         # Simple mock translation - just append language indicator
-        translated_text = f"{text} [Translated to {target_language}]"
+        suffix = self._suffixes.get(target_language)
+        if suffix is None:
+            suffix = self._suffixes[target_language] = f" [Translated to {target_language}]"
         
-        return translated_text, None
+        return text + suffix, None
 
 
 class GoogleTranslator(BaseTranslator):
@@ -241,6 +902,7 @@ class GoogleTranslator(BaseTranslator):
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with optional API key."""
         self.api_key = api_key
+        self.supports_async = AIOHTTP_AVAILABLE and bool(api_key)
         
         # Check if google-cloud-translate is available
         try:
@@ -251,7 +913,7 @@ class GoogleTranslator(BaseTranslator):
             self.google_translate_available = False
             logger.warning("Google Cloud Translate library not available.")
     
-    def translate_text()
+    def translate_text(
         self, 
         text: str, 
         target_language: str,
@@ -266,9 +928,9 @@ class GoogleTranslator(BaseTranslator):
         
         try:
                 # Call the Google Translate API
-            result = self.translate_client.translate()
-                text,
-                target_language=target_language
+            result = _call_with_retry(
+                lambda: self.translate_client.translate(text, target_language=target_language),
+                stop_event
             )
             
             # Extract the translated text from the response
@@ -279,6 +941,54 @@ class GoogleTranslator(BaseTranslator):
         except Exception as e:
             logger.error(f"Google Translate API error: {e}")
             return None, f"Translation error: {e}"
+    
+    def translate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        stop_event: Optional[threading.Event] = None
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Translate several texts with a single Google Translate API request."""
+        if not self.google_translate_available:
+            return [None] * len(texts), "Google Translate library not available."
+        
+        if not self.translate_client:
+            return [None] * len(texts), "Google Translate API key not configured."
+        
+        try:
+                # The client accepts a list of texts and returns one result per text
+            results = _call_with_retry(
+                lambda: self.translate_client.translate(texts, target_language=target_language),
+                stop_event
+            )
+            
+            return [result.get('translatedText', text) for result, text in zip(results, texts)], None
+            
+        except Exception as e:
+            logger.error(f"Google Translate API error: {e}")
+            return [None] * len(texts), f"Translation error: {e}"
+    
+    async def translate_batch_async(
+        self,
+        session,
+        texts: List[str],
+        target_language: str
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Translate several texts with one request to the Google Translate REST API."""
+        try:
+            data = await _post_json(
+                session,
+                GOOGLE_TRANSLATE_URL,
+                params={"key": self.api_key},
+                json={"q": texts, "target": target_language}
+            )
+            
+            results = data["data"]["translations"]
+            return [result.get('translatedText', text) for result, text in zip(results, texts)], None
+            
+        except Exception as e:
+            logger.error(f"Google Translate API error: {e}")
+            return [None] * len(texts), f"Translation error: {e}"
 
 
 class DeepLTranslator(BaseTranslator):
@@ -287,16 +997,18 @@ class DeepLTranslator(BaseTranslator):
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with optional API key."""
         self.api_key = api_key
+        self.supports_async = AIOHTTP_AVAILABLE and bool(api_key)
         
         try:
                 import deepl
             self.deepl_client = deepl.Translator(api_key) if api_key else None
+            self.transient_errors = (deepl.TooManyRequestsException, deepl.ConnectionException)
             self.deepl_available = True
         except ImportError:
             self.deepl_available = False
             logger.warning("DeepL library not available.")
     
-    def translate_text()
+    def translate_text(
         self, 
         text: str, 
         target_language: str,
@@ -310,23 +1022,12 @@ class DeepLTranslator(BaseTranslator):
             return None, "DeepL API key not configured."
         
         try:
-                # Map target language codes to DeepL format if needed
-            deepl_target_language = target_language.upper()
-            if len(target_language) == 2:
-                # Convert ISO 639-1 codes to DeepL format
-                # This mapping may need to be expanded based on DeepL's supported languages'
-                mapping = {
-                    "en": "EN-US",  # Default to US English
-                    "de": "DE",
-                    "fr": "FR",
-                    # Add more mappings as needed
-                }
-                deepl_target_language = mapping.get(target_language, f"{target_language.upper()}")
-            
-            # Call DeepL API
-            result = self.deepl_client.translate_text()
-                text,
-                target_lang=deepl_target_language
+                # Call DeepL API
+            deepl_target_language = self._deepl_target_language(target_language)
+            result = _call_with_retry(
+                lambda: self.deepl_client.translate_text(text, target_lang=deepl_target_language),
+                stop_event,
+                self.transient_errors
             )
             
             return result.text, None
@@ -334,6 +1035,76 @@ class DeepLTranslator(BaseTranslator):
         except Exception as e:
             logger.error(f"DeepL API error: {e}")
             return None, f"Translation error: {e}"
+    
+    def translate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        stop_event: Optional[threading.Event] = None
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Translate several texts using as few DeepL API requests as the request limits allow."""
+        if not self.deepl_available:
+            return [None] * len(texts), "DeepL library not available."
+        
+        if not self.deepl_client:
+            return [None] * len(texts), "DeepL API key not configured."
+        
+        deepl_target_language = self._deepl_target_language(target_language)
+        translations = []
+        try:
+            for chunk in _chunk_texts(texts, DEEPL_MAX_BATCH_TEXTS, DEEPL_MAX_REQUEST_BYTES):
+                if stop_event and stop_event.is_set():
+                    translations.extend([None] * (len(texts) - len(translations)))
+                    return translations, "Translation cancelled."
+                
+                # Call DeepL API with a list of texts
+                results = _call_with_retry(
+                    lambda: self.deepl_client.translate_text(chunk, target_lang=deepl_target_language),
+                    stop_event,
+                    self.transient_errors
+                )
+                translations.extend(result.text for result in results)
+            
+            return translations, None
+            
+        except Exception as e:
+            logger.error(f"DeepL API error: {e}")
+            translations.extend([None] * (len(texts) - len(translations)))
+            return translations, f"Translation error: {e}"
+    
+    async def translate_batch_async(
+        self,
+        session,
+        texts: List[str],
+        target_language: str
+    ) -> Tuple[List[Optional[str]], Optional[str]]:
+        """Translate several texts with as few requests to the DeepL REST API as the request limits allow."""
+        # Free API keys end with ":fx" and use a separate endpoint
+        url = DEEPL_FREE_API_URL if self.api_key.endswith(":fx") else DEEPL_API_URL
+        headers = {"Authorization": f"DeepL-Auth-Key {self.api_key}"}
+        deepl_target_language = self._deepl_target_language(target_language)
+        translations = []
+        try:
+            for chunk in _chunk_texts(texts, DEEPL_MAX_BATCH_TEXTS, DEEPL_MAX_REQUEST_BYTES):
+                data = await _post_json(
+                    session,
+                    url,
+                    headers=headers,
+                    json={"text": chunk, "target_lang": deepl_target_language}
+                )
+                translations.extend(result["text"] for result in data["translations"])
+            
+            return translations, None
+            
+        except Exception as e:
+            logger.error(f"DeepL API error: {e}")
+            translations.extend([None] * (len(texts) - len(translations)))
+            return translations, f"Translation error: {e}"
+    
+    @staticmethod
+    def _deepl_target_language(target_language: str) -> str:
+        """Map a target language code to DeepL format if needed."""
+        return _DEEPL_LANG_MAP.get(target_language.lower(), target_language.upper())
 
 
 class LocalModelTranslator(BaseTranslator):
@@ -345,7 +1116,7 @@ class LocalModelTranslator(BaseTranslator):
         self.local_translation_available = False
         logger.warning("Local translation model not implemented yet.")
     
-    def translate_text()
+    def translate_text(
         self, 
         text: str, 
         target_language: str,
@@ -0,0 +1,25 @@
+"""
+Qt binding selection for YouTube Translator Pro.
+Imports the Qt classes used by the widgets from PyQt6, falling back to PyQt5.
+"""
+
+try:
+    from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+    from PyQt6.QtGui import QIcon, QStandardItem, QStandardItemModel
+    from PyQt6.QtWidgets import (
+        QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QPushButton,
+        QProgressBar, QGroupBox, QComboBox, QLineEdit, QFileDialog,
+        QCheckBox, QListWidget, QListWidgetItem, QDialog, QTabWidget, QStyle,
+        QSpinBox, QTextEdit, QPlainTextEdit, QDialogButtonBox, QScrollArea
+    )
+    USE_PYQT6 = True
+except ImportError:
+    from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+    from PyQt5.QtGui import QIcon, QStandardItem, QStandardItemModel
+    from PyQt5.QtWidgets import (
+        QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QPushButton,
+        QProgressBar, QGroupBox, QComboBox, QLineEdit, QFileDialog,
+        QCheckBox, QListWidget, QListWidgetItem, QDialog, QTabWidget, QStyle,
+        QSpinBox, QTextEdit, QPlainTextEdit, QDialogButtonBox, QScrollArea
+    )
+    USE_PYQT6 = False
@@ -6,28 +6,11 @@ Displays the current status and progress of batch processing.
 import logging
 from typing import Optional
 
-try:
-    try:
-    from PyQt6.QtCore import Qt, pyqtSlot
-except ImportError:
-    from PyQt5.QtCore import Qt, pyqtSlot
-except ImportError:
-    from PyQt5.QtCore import Qt, pyqtSlot
-
-try:
-    try:
-    from PyQt6.QtWidgets import ()
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-        QProgressBar, QGroupBox
-    )
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-        QProgressBar, QGroupBox
-    )
-
+from src.ui._qt import (
+    Qt, QTimer, pyqtSlot,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QProgressBar, QGroupBox
+)
 from src.ui.styles import StyleManager
 
 # Logger setup
@@ -36,6 +19,12 @@ logger = logging.getLogger(__name__)
 class BatchStatusWidget(QWidget):
     """Widget for displaying batch processing status and progress."""
     
+    # Label style and (start, pause, cancel) button states for statuses without their own entry
+    DEFAULT_STATUS_CONFIG = ("font-weight: bold;", False, False, False)
+    
+    # Progress and message updates are applied at most this often (about 30 Hz)
+    UPDATE_INTERVAL_MS = 33
+    
     def __init__(self, app_manager, parent=None):
         """"
         Initialize the batch status widget.
@@ -48,6 +37,22 @@ class BatchStatusWidget(QWidget):
         self.app_manager = app_manager
         self.style_manager = StyleManager()
         
+        # Label style and button states per status name, built once since the styles depend on the theme
+        colors = self.style_manager.colors
+        self.status_config = {
+            "IDLE": ("font-weight: bold;", True, False, False),
+            "RUNNING": (f"font-weight: bold; color: {colors['accent']};", False, True, True),
+            "PAUSED": (f"font-weight: bold; color: {colors['warning']};", True, False, True),
+        }
+        
+        # Latest progress and message waiting for the next flush
+        self._pending_progress = None
+        self._pending_message = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_updates)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -114,52 +119,63 @@ class BatchStatusWidget(QWidget):
         Args:
             status: The new batch status
         """"
-        # Convert status enum to string
-        status_text = str(status).split('.')[-1] if hasattr(status, 'name') else str(status)
+        status_text = getattr(status, 'name', str(status))
+        label_style, start_enabled, pause_enabled, cancel_enabled = self.status_config.get(
+            status_text, self.DEFAULT_STATUS_CONFIG
+        )
         
         # Update status label
         self.status_label.setText(status_text)
+        self.status_label.setStyleSheet(label_style)
         
         # Update button states based on status
-        is_idle = status_text == "IDLE"
-        is_running = status_text == "RUNNING"
-        is_paused = status_text == "PAUSED"
-        
-        self.start_button.setEnabled(is_idle or is_paused)
-        self.pause_button.setEnabled(is_running)
-        self.cancel_button.setEnabled(is_running or is_paused)
-        
-        # Update status color
-        if is_idle:
-            self.status_label.setStyleSheet("font-weight: bold;")
-        elif is_running:
-            self.status_label.setStyleSheet(f"font-weight: bold; color: {self.style_manager.colors['accent']};")
-        elif is_paused:
-            self.status_label.setStyleSheet(f"font-weight: bold; color: {self.style_manager.colors['warning']};")
-        else:
-            self.status_label.setStyleSheet("font-weight: bold;")
+        self.start_button.setEnabled(start_enabled)
+        self.pause_button.setEnabled(pause_enabled)
+        self.cancel_button.setEnabled(cancel_enabled)
     
     @pyqtSlot(float)
     def update_progress(self, progress: float):
         """"
         Update the progress bar.
         
+        Rapid updates are coalesced; only the latest value is shown on the next flush.
+        
         Args:
             progress: The progress value (0.0 to 1.0)
         """"
         # Convert to percentage (0-100)
-        percentage = int(progress * 100)
-        self.progress_bar.setValue(percentage)
+        self._pending_progress = int(progress * 100)
+        self._schedule_flush()
     
     @pyqtSlot(str)
     def update_message(self, message: str):
         """"
         Update the status message.
         
+        Rapid updates are coalesced; only the latest message is shown on the next flush.
+        
         Args:
             message: The new status message
         """"
-        self.message_label.setText(message)
+        self._pending_message = message
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Start the flush timer unless a flush is already scheduled."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_updates(self):
+        """Apply the latest pending progress and message."""
+        if self._pending_progress is not None:
+            if self._pending_progress != self.progress_bar.value():
+                self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = None
+        
+        if self._pending_message is not None:
+            if self._pending_message != self.message_label.text():
+                self.message_label.setText(self._pending_message)
+            self._pending_message = None
     
     def _start_batch(self):
         """Start or resume batch processing."""
@@ -7,30 +7,12 @@ import logging
 from typing import List, Optional
 from pathlib import Path
 
-try:
-    try:
-    from PyQt6.QtCore import Qt, pyqtSignal
-except ImportError:
-    from PyQt5.QtCore import Qt, pyqtSignal
-except ImportError:
-    from PyQt5.QtCore import Qt, pyqtSignal
-
-try:
-    try:
-    from PyQt6.QtWidgets import ()
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-        QComboBox, QGroupBox, QFormLayout, QLineEdit, QFileDialog,
-        QCheckBox, QListWidget, QListWidgetItem
-    )
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-        QComboBox, QGroupBox, QFormLayout, QLineEdit, QFileDialog,
-        QCheckBox, QListWidget, QListWidgetItem
-    )
-
+from src.ui._qt import (
+    Qt, pyqtSignal,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QComboBox, QGroupBox, QFormLayout, QLineEdit, QFileDialog,
+    QCheckBox, QListWidget, QListWidgetItem
+)
 from src.ui.styles import StyleManager
 from src.config import TRANSCRIPTION_MODELS, TRANSLATION_LANGUAGES
 
@@ -173,12 +155,18 @@ class ControlPanelWidget(QWidget):
             ("CSV", "CSV transcript data", False)
         ]
         
+        # Checked state of each format in list order, kept in sync through itemChanged
+        self._format_checked = {}
+        
         for format_id, description, default in formats:
             item = QListWidgetItem(f"{format_id} - {description}")
             item.setData(Qt.ItemDataRole.UserRole, format_id.lower())
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item.setCheckState(Qt.CheckState.Checked if default else Qt.CheckState.Unchecked)
             self.format_list.addItem(item)
+            self._format_checked[format_id.lower()] = default
+        
+        self.format_list.itemChanged.connect(self._on_format_changed)
         
         layout.addWidget(self.format_list)
         
@@ -202,6 +190,10 @@ class ControlPanelWidget(QWidget):
             self.output_dir_edit.setText(directory)
             self.output_dir_changed.emit(directory)
     
+    def _on_format_changed(self, item: QListWidgetItem):
+        """Track the checked state of an output format."""
+        self._format_checked[item.data(Qt.ItemDataRole.UserRole)] = item.checkState() == Qt.CheckState.Checked
+    
     def get_model(self) -> str:
         """"
         Get the selected transcription model.
@@ -236,12 +228,7 @@ class ControlPanelWidget(QWidget):
         Returns:
             List of selected format codes
         """"
-        formats = []
-        for i in range(self.format_list.count()):
-            item = self.format_list.item(i)
-            if item.checkState() == Qt.CheckState.Checked:
-                formats.append(item.data(Qt.ItemDataRole.UserRole))
-        return formats
+        return [format_id for format_id, checked in self._format_checked.items() if checked]
     
     def is_auto_open_enabled(self) -> bool:
         """"
@@ -4,44 +4,60 @@ Contains all dialogs used in the application.
 """"
 
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 
-try:
-    try:
-    from PyQt6.QtCore import Qt
-except ImportError:
-    from PyQt5.QtCore import Qt
-except ImportError:
-    from PyQt5.QtCore import Qt
-
-try:
-    try:
-    from PyQt6.QtWidgets import ()
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-        QTabWidget, QWidget, QFormLayout, QLineEdit, QSpinBox,
-        QCheckBox, QComboBox, QFileDialog, QTextEdit, QGroupBox,
-        QDialogButtonBox, QScrollArea
-    )
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-        QTabWidget, QWidget, QFormLayout, QLineEdit, QSpinBox,
-        QCheckBox, QComboBox, QFileDialog, QTextEdit, QGroupBox,
-        QDialogButtonBox, QScrollArea
-    )
-
-from src.ui.styles import StyleManager
+from src.ui._qt import (
+    Qt, QTimer, pyqtSlot, QIcon, QStandardItem, QStandardItemModel,
+    QDialog, QStyle, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTabWidget, QWidget, QFormLayout, QLineEdit, QSpinBox,
+    QCheckBox, QComboBox, QFileDialog, QPlainTextEdit, QGroupBox,
+    QDialogButtonBox, QScrollArea
+)
+from src.ui.styles import get_style_manager
 from src.config import APP_NAME, APP_VERSION, TRANSCRIPTION_MODELS, TRANSLATION_LANGUAGES
 
+# NOTE: This module is pure Qt widget wiring with no numeric loops, so it gains
+# nothing from numpy or JIT compilation. Its costs are widget construction and
+# Python-to-Qt calls; keep any data processing in a worker module instead.
+
 # Logger setup
 logger = logging.getLogger(__name__)
 
-class SettingsDialog(QDialog):
+# Combo box labels, built once from the static config
+TRANSCRIPTION_MODELS_DISPLAY = tuple(model.capitalize() for model in TRANSCRIPTION_MODELS)
+_THEME_ITEMS = ("Dark", "Light")
+
+# Row of each language code in the settings language combo box
+_LANGUAGE_CODE_TO_INDEX = {code: index for index, code in enumerate(TRANSLATION_LANGUAGES)}
+
+@lru_cache(maxsize=None)
+def _error_message_style(color: str) -> str:
+    """Get the stylesheet for an error message in the given color."""
+    return f"color: {color}; font-weight: bold;"
+
+class _StyledDialog(QDialog):
+    """Dialog whose style is applied once the event loop has painted it."""
+    
+    def _apply_styles_later(self):
+        """Apply styles after the first paint; the application stylesheet covers it until then."""
+        # A bound slot lets Qt drop the call if the dialog is deleted first
+        QTimer.singleShot(0, self._apply_styles)
+    
+    @pyqtSlot()
+    def _apply_styles(self):
+        """Apply the current style to the dialog."""
+        self.style_manager.apply_styles(self)
+
+
+class SettingsDialog(_StyledDialog):
     """Dialog for application settings."""
     
+    # Starting directory for browsing when no output directory is set
+    _home_dir = str(Path.home())
+    
     def __init__(self, current_settings: Dict[str, Any], parent=None):
         """"
         Initialize the settings dialog.
@@ -51,11 +67,38 @@ class SettingsDialog(QDialog):
             parent: The parent widget
         """"
         super().__init__(parent)
-        self.current_settings = current_settings.copy()
-        self.style_manager = StyleManager()
+        # Read-only view; the dialog never writes to the settings it was given
+        self.current_settings = MappingProxyType(current_settings)
+        self.style_manager = get_style_manager()
+        
+        # Directory picker, created on first browse and reused afterwards
+        self._file_dialog = None
+        
+        # Settings captured on accept, since the widgets are deleted on close
+        self._accepted_settings = None
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
         
         self._setup_ui()
     
+    @classmethod
+    def open_for(cls, parent, current_settings: Dict[str, Any],
+                 on_accept: Callable[[Dict[str, Any]], None]) -> "SettingsDialog":
+        """"
+        Show the settings dialog without blocking the event loop.
+        
+        Args:
+            parent: The parent widget
+            current_settings: The current application settings
+            on_accept: Called with the updated settings if the dialog is accepted
+            
+        Returns:
+            The opened dialog
+        """"
+        dialog = cls(current_settings, parent)
+        dialog.accepted.connect(lambda: on_accept(dialog.get_settings()))
+        dialog.open()
+        return dialog
+    
     def _setup_ui(self):
         """Set up the user interface."""
         # Dialog settings
@@ -67,28 +110,26 @@ class SettingsDialog(QDialog):
         main_layout = QVBoxLayout(self)
         
         # Create tabs for different settings categories
-        tab_widget = QTabWidget()
-        main_layout.addWidget(tab_widget)
-        
-        # General tab
-        general_tab = QWidget()
-        tab_widget.addTab(general_tab, "General")
-        self._setup_general_tab(general_tab)
-        
-        # Transcription tab
-        transcription_tab = QWidget()
-        tab_widget.addTab(transcription_tab, "Transcription")
-        self._setup_transcription_tab(transcription_tab)
-        
-        # Translation tab
-        translation_tab = QWidget()
-        tab_widget.addTab(translation_tab, "Translation")
-        self._setup_translation_tab(translation_tab)
+        self.tab_widget = QTabWidget()
+        main_layout.addWidget(self.tab_widget)
+        
+        # Tab pages and their builders by tab index; the General tab is built
+        # now, the others start empty and are filled in when first shown
+        tabs = (
+            ("General", self._setup_general_tab),
+            ("Transcription", self._setup_transcription_tab),
+            ("Translation", self._setup_translation_tab),
+            ("Advanced", self._setup_advanced_tab),
+        )
+        self._tab_pages: Tuple[QWidget, ...] = tuple(QWidget() for _ in tabs)
+        for page, (title, _) in zip(self._tab_pages, tabs):
+            self.tab_widget.addTab(page, title)
         
-        # Advanced tab
-        advanced_tab = QWidget()
-        tab_widget.addTab(advanced_tab, "Advanced")
-        self._setup_advanced_tab(advanced_tab)
+        self._setup_general_tab(self._tab_pages[0])
+        self._tab_builders: Tuple[Optional[Callable[[QWidget], None]], ...] = (
+            (None,) + tuple(builder for _, builder in tabs[1:])
+        )
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Add buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -96,8 +137,19 @@ class SettingsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
         
-        # Apply styles
-        self.style_manager.apply_styles(self)
+        self._apply_styles_later()
+    
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int):
+        """Build a tab the first time it is shown."""
+        builder = self._tab_builders[index]
+        if builder is not None:
+            builder(self._tab_pages[index])
+            self._tab_builders = self._tab_builders[:index] + (None,) + self._tab_builders[index + 1:]
+    
+    def _is_tab_built(self, builder) -> bool:
+        """Check whether the tab set up by builder has been built."""
+        return builder not in self._tab_builders
     
     def _setup_general_tab(self, tab: QWidget):
         """Set up the general settings tab."""
@@ -105,22 +157,23 @@ class SettingsDialog(QDialog):
         
         # Theme selection
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Dark", "Light"])
+        self.theme_combo.addItems(_THEME_ITEMS)
         current_theme = self.current_settings.get("theme", "dark")
         self.theme_combo.setCurrentText(current_theme.capitalize())
         layout.addRow("Theme:", self.theme_combo)
         
-        # Output directory
-        output_dir_layout = QHBoxLayout()
+        # Output directory, browsed through a button inside the line edit
         self.output_dir_edit = QLineEdit(self.current_settings.get("output_dir", ""))
         self.output_dir_edit.setReadOnly(True)
-        output_dir_layout.addWidget(self.output_dir_edit)
         
-        self.browse_button = QPushButton("Browse...")
-        self.browse_button.clicked.connect(self._browse_output_dir)
-        output_dir_layout.addWidget(self.browse_button)
+        folder_icon = QIcon.fromTheme(
+            "folder-open", self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon)
+        )
+        browse_action = self.output_dir_edit.addAction(folder_icon, QLineEdit.ActionPosition.TrailingPosition)
+        browse_action.setToolTip("Browse...")
+        browse_action.triggered.connect(self._browse_output_dir)
         
-        layout.addRow("Output Directory:", output_dir_layout)
+        layout.addRow("Output Directory:", self.output_dir_edit)
         
         # Concurrency setting
         self.concurrency_spin = QSpinBox()
@@ -135,7 +188,7 @@ class SettingsDialog(QDialog):
         
         # Default transcription model
         self.model_combo = QComboBox()
-        self.model_combo.addItems([model.capitalize() for model in TRANSCRIPTION_MODELS])
+        self.model_combo.addItems(TRANSCRIPTION_MODELS_DISPLAY)
         current_model = self.current_settings.get("default_model", "small")
         self.model_combo.setCurrentText(current_model.capitalize())
         layout.addRow("Default Model:", self.model_combo)
@@ -159,12 +212,18 @@ class SettingsDialog(QDialog):
         layout = QFormLayout(tab)
         
         # Default target language
+        # Fill a model off-widget so the combo box is populated in one step
+        model = QStandardItemModel(len(TRANSLATION_LANGUAGES), 1)
+        for row, (code, name) in enumerate(TRANSLATION_LANGUAGES.items()):
+            item = QStandardItem(name)
+            item.setData(code, Qt.ItemDataRole.UserRole)
+            model.setItem(row, 0, item)
+        
         self.language_combo = QComboBox()
-        for code, name in TRANSLATION_LANGUAGES.items():
-            self.language_combo.addItem(name, code)
+        self.language_combo.setModel(model)
         
         current_language = self.current_settings.get("default_language", "None")
-        index = self.language_combo.findData(current_language)
+        index = _LANGUAGE_CODE_TO_INDEX.get(current_language, -1)
         if index >= 0:
             self.language_combo.setCurrentIndex(index)
         layout.addRow("Default Target Language:", self.language_combo)
@@ -182,62 +241,60 @@ class SettingsDialog(QDialog):
     
     def _setup_advanced_tab(self, tab: QWidget):
         """Set up the advanced settings tab."""
-        layout = QVBoxLayout(tab)
+        update_config = self.current_settings.get("update_config") or {}
+        layout = QFormLayout(tab)
         
         # Performance settings
-        performance_group = QGroupBox("Performance")
-        performance_layout = QFormLayout(performance_group)
+        layout.addRow(QLabel("<b>Performance</b>"))
         
         # Retry settings
         self.max_retries_spin = QSpinBox()
         self.max_retries_spin.setMinimum(0)
         self.max_retries_spin.setMaximum(10)
         self.max_retries_spin.setValue(self.current_settings.get("max_retries", 3))
-        performance_layout.addRow("Max Retries:", self.max_retries_spin)
+        layout.addRow("Max Retries:", self.max_retries_spin)
         
         self.retry_delay_spin = QSpinBox()
         self.retry_delay_spin.setMinimum(1)
         self.retry_delay_spin.setMaximum(60)
         self.retry_delay_spin.setSuffix(" seconds")
         self.retry_delay_spin.setValue(self.current_settings.get("retry_delay", 5))
-        performance_layout.addRow("Initial Retry Delay:", self.retry_delay_spin)
-        
-        layout.addWidget(performance_group)
+        layout.addRow("Initial Retry Delay:", self.retry_delay_spin)
         
         # Update settings
-        update_group = QGroupBox("Updates")
-        update_layout = QFormLayout(update_group)
+        layout.addRow(QLabel("<b>Updates</b>"))
         
         self.auto_check_updates = QCheckBox("Check for updates automatically")
-        self.auto_check_updates.setChecked()
-            self.current_settings.get("update_config", {}).get("auto_check", True)
-        )
-        update_layout.addRow("", self.auto_check_updates)
+        self.auto_check_updates.setChecked(update_config.get("auto_check", True))
+        layout.addRow("", self.auto_check_updates)
         
         self.update_interval_spin = QSpinBox()
         self.update_interval_spin.setMinimum(1)
         self.update_interval_spin.setMaximum(168)
         self.update_interval_spin.setSuffix(" hours")
-        self.update_interval_spin.setValue()
-            self.current_settings.get("update_config", {}).get("check_interval", 24)
-        )
-        update_layout.addRow("Check Interval:", self.update_interval_spin)
-        
-        layout.addWidget(update_group)
-        
-        # Add spacer at the bottom
-        layout.addStretch()
+        self.update_interval_spin.setValue(update_config.get("check_interval", 24))
+        layout.addRow("Check Interval:", self.update_interval_spin)
     
+    @pyqtSlot()
     def _browse_output_dir(self):
         """Open a file dialog to select the output directory."""
-        current_dir = self.output_dir_edit.text() or Path.home()
-        directory = QFileDialog.getExistingDirectory()
-            self,
-            "Select Output Directory",
-            str(current_dir)
-        )
-        if directory:
-            self.output_dir_edit.setText(directory)
+        if self._file_dialog is None:
+            # Qt's own dialog avoids the slow native dialog startup on Windows
+            self._file_dialog = QFileDialog(self, "Select Output Directory")
+            self._file_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._file_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            self._file_dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        
+        self._file_dialog.setDirectory(self.output_dir_edit.text() or self._home_dir)
+        if self._file_dialog.exec():
+            directories = self._file_dialog.selectedFiles()
+            if directories:
+                self.output_dir_edit.setText(directories[0])
+    
+    def accept(self):
+        """Capture the entered settings and close the dialog."""
+        self._accepted_settings = self.get_settings()
+        super().accept()
     
     def get_settings(self) -> Dict[str, Any]:
         """"
@@ -246,29 +303,58 @@ class SettingsDialog(QDialog):
         Returns:
             Dictionary containing the updated settings
         """"
-        # Get settings from UI components
-        settings = {
+        if self._accepted_settings is not None:
+            return self._accepted_settings
+        
+        # Tabs that were never shown keep their current values
+        current = self.current_settings
+        update_config = current.get("update_config") or {}
+        
+        if self._is_tab_built(self._setup_transcription_tab):
+            default_model = self.model_combo.currentText().lower()
+            cache_enabled = self.cache_enabled.isChecked()
+            cache_size_mb = self.cache_size_spin.value()
+        else:
+            default_model = current.get("default_model", "small")
+            cache_enabled = current.get("cache_enabled", True)
+            cache_size_mb = current.get("cache_size_mb", 1000)
+        
+        if self._is_tab_built(self._setup_translation_tab):
+            default_language = self.language_combo.currentData()
+        else:
+            default_language = current.get("default_language", "None")
+        
+        if self._is_tab_built(self._setup_advanced_tab):
+            max_retries = self.max_retries_spin.value()
+            retry_delay = self.retry_delay_spin.value()
+            auto_check = self.auto_check_updates.isChecked()
+            check_interval = self.update_interval_spin.value()
+        else:
+            max_retries = current.get("max_retries", 3)
+            retry_delay = current.get("retry_delay", 5)
+            auto_check = update_config.get("auto_check", True)
+            check_interval = update_config.get("check_interval", 24)
+        
+        return {
             "theme": self.theme_combo.currentText().lower(),
             "output_dir": self.output_dir_edit.text(),
             "concurrency": self.concurrency_spin.value(),
-            "default_model": self.model_combo.currentText().lower(),
-            "cache_enabled": self.cache_enabled.isChecked(),
-            "cache_size_mb": self.cache_size_spin.value(),
-            "default_language": self.language_combo.currentData(),
-            "max_retries": self.max_retries_spin.value(),
-            "retry_delay": self.retry_delay_spin.value(),
+            "default_model": default_model,
+            "cache_enabled": cache_enabled,
+            "cache_size_mb": cache_size_mb,
+            "default_language": default_language,
+            "max_retries": max_retries,
+            "retry_delay": retry_delay,
             "update_config": {
-                "auto_check": self.auto_check_updates.isChecked(),
-                "check_interval": self.update_interval_spin.value(),
                 # Preserve other update settings
-                **self.current_settings.get("update_config", {})
+                **update_config,
+                "auto_check": auto_check,
+                "check_interval": check_interval,
             }
         }
-        
-        return settings
 
 
-class AboutDialog(QDialog):
+class AboutDialog(_StyledDialog):
     """Dialog showing information about the application."""
     
     def __init__(self, parent=None):
@@ -279,7 +365,7 @@ class AboutDialog(QDialog):
             parent: The parent widget
         """"
         super().__init__(parent)
-        self.style_manager = StyleManager()
+        self.style_manager = get_style_manager()
         
         self._setup_ui()
     
@@ -304,7 +390,7 @@ class AboutDialog(QDialog):
         layout.addSpacing(20)
         
         # Description
-        description = ()
+        description = (
             "YouTube Translator Pro is an advanced desktop application for transcribing "
             "and translating YouTube videos. It utilizes cutting-edge AI models to provide "
             "high-quality transcriptions and translations in multiple languages."
@@ -328,10 +414,10 @@ class AboutDialog(QDialog):
             "Advanced caching for improved performance"
         ]
         
-        for feature in features:
-            feature_label = QLabel(f"• {feature}")
-            feature_label.setWordWrap(True)
-            features_layout.addWidget(feature_label)
+        features_label = QLabel("<ul>" + "".join(f"<li>{feature}</li>" for feature in features) + "</ul>")
+        features_label.setTextFormat(Qt.TextFormat.RichText)
+        features_label.setWordWrap(True)
+        features_layout.addWidget(features_label)
         
         layout.addWidget(features_group)
         layout.addSpacing(20)
@@ -346,11 +432,39 @@ class AboutDialog(QDialog):
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button, alignment=Qt.AlignmentFlag.AlignCenter)
         
-        # Apply styles
-        self.style_manager.apply_styles(self)
+        self._apply_styles_later()
+
+
+# The about dialog is static, so it is built once and reused
+_about_dialog: Optional[AboutDialog] = None
+
+
+def _forget_about_dialog():
+    """Drop the cached about dialog once Qt has deleted it."""
+    global _about_dialog
+    _about_dialog = None
 
 
-class ErrorDialog(QDialog):
+def show_about(parent=None):
+    """"
+    Show the about dialog, building it on first use.
+    
+    Args:
+        parent: The parent widget
+    """"
+    global _about_dialog
+    if _about_dialog is None:
+        _about_dialog = AboutDialog(parent)
+        _about_dialog.destroyed.connect(_forget_about_dialog)
+    elif _about_dialog.parent() is not parent:
+        _about_dialog.setParent(parent, Qt.WindowType.Dialog)
+    
+    _about_dialog.show()
+    _about_dialog.raise_()
+    _about_dialog.activateWindow()
+
+
+class ErrorDialog(_StyledDialog):
     """Dialog for displaying error information."""
     
     def __init__(self, message: str, details: str, parent=None):
@@ -363,12 +477,30 @@ class ErrorDialog(QDialog):
             parent: The parent widget
         """"
         super().__init__(parent)
-        self.style_manager = StyleManager()
+        self.style_manager = get_style_manager()
         self.message = message
         self.details = details
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
         
         self._setup_ui()
     
+    @classmethod
+    def open_for(cls, parent, message: str, details: str) -> "ErrorDialog":
+        """"
+        Show an error dialog without blocking the event loop.
+        
+        Args:
+            parent: The parent widget
+            message: The error message
+            details: Detailed error information
+            
+        Returns:
+            The opened dialog
+        """"
+        dialog = cls(message, details, parent)
+        dialog.open()
+        return dialog
+    
     def _setup_ui(self):
         """Set up the user interface."""
         # Dialog settings
@@ -385,7 +517,7 @@ class ErrorDialog(QDialog):
         # Error message
         message_label = QLabel(self.message)
         message_label.setWordWrap(True)
-        message_label.setStyleSheet(f"color: {self.style_manager.colors['error']}; font-weight: bold;")
+        message_label.setStyleSheet(_error_message_style(self.style_manager.colors['error']))
         layout.addWidget(message_label)
         
         layout.addSpacing(10)
@@ -395,9 +527,13 @@ class ErrorDialog(QDialog):
             details_group = QGroupBox("Error Details")
             details_layout = QVBoxLayout(details_group)
             
-            details_edit = QTextEdit()
+            # Tracebacks are plain text
+            details_edit = QPlainTextEdit()
             details_edit.setReadOnly(True)
-            details_edit.setText(self.details)
+            details_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+            details_edit.setPlainText(self.details)
+            # The text edit now holds the only copy needed
+            self.details = ""
             details_layout.addWidget(details_edit)
             
             layout.addWidget(details_group)
@@ -407,5 +543,4 @@ class ErrorDialog(QDialog):
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
         
-        # Apply styles
-        self.style_manager.apply_styles(self)
+        self._apply_styles_later()
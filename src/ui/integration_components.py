@@ -4,43 +4,26 @@ Provides helper methods to integrate new features into the main application.
 """"
 
 import os
+import copy
+import queue
 import logging
 import threading
-from functools import partial
+from functools import partial, lru_cache
+from types import SimpleNamespace
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Only the timer and signal classes are imported up front; the widget classes
+# and dialogs are imported when a feature first needs them
+_QT_MOCKS = None
 try:
-    # First try PyQt6
-    try:
-    from PyQt6.QtWidgets import ()
-except ImportError:
-    from PyQt5.QtWidgets import ()
-        QToolBar, QMenu, QStatusBar, QLabel,
-        QMenuBar, QMainWindow, QMessageBox, QDialog,
-        QVBoxLayout
-    )
-    try:
-    from PyQt6.QtGui import QAction, QIcon
-except ImportError:
-    from PyQt5.QtGui import QAction, QIcon
-    try:
-    from PyQt6.QtCore import Qt, QSettings, QTimer, pyqtSignal
-except ImportError:
-    from PyQt5.QtCore import Qt, QSettings, QTimer, pyqtSignal
+    from PyQt6.QtCore import QTimer, pyqtSignal
     USE_PYQT6 = True
     logger.info("Using PyQt6 for UI integration components")
 except ImportError:
     try:
-        # Then try PyQt5
-        from PyQt5.QtWidgets import ()
-            QToolBar, QMenu, QStatusBar, QLabel,
-            QMenuBar, QMainWindow, QMessageBox, QDialog,
-            QVBoxLayout
-        )
-        from PyQt5.QtGui import QAction, QIcon
-        from PyQt5.QtCore import Qt, QSettings, QTimer, pyqtSignal
+        from PyQt5.QtCore import QTimer, pyqtSignal
         USE_PYQT6 = False
         logger.info("Using PyQt5 for UI integration components")
     except ImportError:
@@ -48,32 +31,28 @@ except ImportError:
         logger.warning("Neither PyQt6 nor PyQt5 is available. Creating mock classes for integration components.")
         USE_PYQT6 = False
         
-        # Mock implementations for QtWidgets classes
-        class QToolBar:
-            def __init__(self, *args, **kwargs): pass
-            def addAction(self, *args, **kwargs): pass
-            def addSeparator(self, *args, **kwargs): pass
-        
-        class QMenu:
-            def __init__(self, *args, **kwargs): pass
-            def addAction(self, *args, **kwargs): pass
-            def addSeparator(self, *args, **kwargs): pass
-            
-        class QStatusBar:
-            def __init__(self, *args, **kwargs): pass
-            def showMessage(self, *args, **kwargs): pass
-            
-        class QLabel:
+        class QTimer:
             def __init__(self, *args, **kwargs): pass
-            def setText(self, *args, **kwargs): pass
+            timeout = property(lambda self: MockSignal())
+            def setSingleShot(self, *args, **kwargs): pass
+            def setInterval(self, *args, **kwargs): pass
+            def start(self, *args, **kwargs): pass
+            def stop(self): pass
+            @staticmethod
+            def singleShot(*args, **kwargs): pass
             
-        class QMenuBar:
-            def __init__(self, *args, **kwargs): pass
-            def addMenu(self, *args, **kwargs): pass
+        class MockSignal:
+            def __init__(self): pass
+            def connect(self, func): pass
+            def emit(self, *args): pass
             
-        class QMainWindow:
-            def __init__(self, *args, **kwargs): pass
-            def setCentralWidget(self, *args, **kwargs): pass
+        # Alias for pyqtSignal
+        pyqtSignal = lambda *args, **kwargs: MockSignal()
+        
+        # Mock implementations for the classes _qt() hands out
+        class QApplication:
+            @staticmethod
+            def instance(): return None
             
         class QMessageBox:
             def __init__(self, *args, **kwargs): pass
@@ -86,55 +65,123 @@ except ImportError:
             
         class QDialog:
             def __init__(self, *args, **kwargs): pass
+            def setWindowTitle(self, *args, **kwargs): pass
+            def setMinimumWidth(self, *args, **kwargs): pass
+            def setMinimumHeight(self, *args, **kwargs): pass
+            def show(self): pass
+            def raise_(self): pass
             def exec(self, *args, **kwargs): pass
             
         class QVBoxLayout:
             def __init__(self, *args, **kwargs): pass
             def addWidget(self, *args, **kwargs): pass
             
-        # Mock implementations for QtGui classes
         class QAction:
             def __init__(self, *args, **kwargs): pass
-            def triggered(self): return MockSignal()
+            triggered = property(lambda self: MockSignal())
             def setEnabled(self, *args, **kwargs): pass
-            
-        class QIcon:
-            def __init__(self, *args, **kwargs): pass
-            
-        # Mock implementations for QtCore classes
-        class Qt:
-            AlignCenter = 0
-            AlignLeft = 0
-            AlignRight = 0
-            
-        class QSettings:
-            def __init__(self, *args, **kwargs): pass
-            def setValue(self, *args, **kwargs): pass
-            def value(self, *args, **kwargs): return None
-            
-        class QTimer:
-            def __init__(self, *args, **kwargs): pass
-            def timeout(self): return MockSignal()
-            def start(self, *args, **kwargs): pass
-            def stop(self): pass
-            
-        class MockSignal:
-            def __init__(self): pass
-            def connect(self, func): pass
-            def emit(self, *args): pass
-            
-        # Alias for pyqtSignal
-        pyqtSignal = lambda *args, **kwargs: MockSignal()
+        
+        _QT_MOCKS = SimpleNamespace(
+            QApplication=QApplication,
+            QMessageBox=QMessageBox,
+            QDialog=QDialog,
+            QVBoxLayout=QVBoxLayout,
+            QAction=QAction
+        )
 
 from src.utils.localization import localization, get_string
 from src.utils.telemetry import telemetry
 from src.utils.performance_monitor import monitor, measure_performance
-from src.ui.language_selector import LanguageSelector
-from src.ui.performance_monitor_widget import PerformanceMonitorWidget
-from src.ui.settings_dialog import SettingsDialog
-from src.ui.telemetry_consent_dialog import TelemetryConsentDialog
 from src.config import get_settings, save_settings, VERSION
 
+# Settings changes are written once no further change arrives for this long
+SETTINGS_SAVE_DELAY_MS = 500
+
+# How long to wait for the last settings write when the application quits
+SETTINGS_WRITER_JOIN_TIMEOUT = 5.0
+
+@lru_cache(maxsize=None)
+def _qt() -> SimpleNamespace:
+    """"
+    Import the Qt widget classes used by the integrator on first use.
+    
+    Returns:
+        Namespace holding the Qt classes, or their mocks when no Qt binding
+        is installed
+    """"
+    if _QT_MOCKS is not None:
+        return _QT_MOCKS
+    if USE_PYQT6:
+        from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog, QVBoxLayout
+        from PyQt6.QtGui import QAction
+    else:
+        from PyQt5.QtWidgets import QApplication, QMessageBox, QDialog, QVBoxLayout, QAction
+    
+    return SimpleNamespace(
+        QApplication=QApplication,
+        QMessageBox=QMessageBox,
+        QDialog=QDialog,
+        QVBoxLayout=QVBoxLayout,
+        QAction=QAction
+    )
+
+class _SettingsWriter:
+    """Writes settings snapshots on a background thread, keeping only the latest."""
+    
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=1)
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def submit(self, settings):
+        """"
+        Queue a snapshot of the settings for writing.
+        
+        Args:
+            settings: The settings to save
+        """"
+        snapshot = copy.deepcopy(settings)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SettingsWriter", daemon=True)
+                self._thread.start()
+            
+            # Replace a snapshot that hasn't been written yet
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(snapshot)
+    
+    def close(self, timeout=SETTINGS_WRITER_JOIN_TIMEOUT):
+        """"
+        Write any queued snapshot and stop the writer thread.
+        
+        Args:
+            timeout: Seconds to wait for the pending write
+        """"
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Settings writer did not finish before shutdown")
+            return
+        thread.join(timeout)
+    
+    def _run(self):
+        """Write queued snapshots until told to stop."""
+        while True:
+            settings = self._queue.get()
+            if settings is None:
+                return
+            save_settings(settings)
+
+_settings_writer = _SettingsWriter()
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -155,23 +202,46 @@ class FeatureIntegrator:
         self.language_selector = None
         self.performance_dialog = None
         
+        # Settings writes are coalesced and flushed when the application quits
+        self._settings_dirty = False
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush_settings)
+        
+        app = _qt().QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._on_about_to_quit)
+        
         # Load telemetry consent status
         self.check_telemetry_consent()
         
     def integrate_all_features(self):
-        """Integrate all new features into the application."""
+        """"
+        Integrate all new features into the application.
+        
+        Features visible on the first frame are added now; menu entries are
+        added once the event loop is running so they don't delay the first paint.
+        """"
+        self.integrate_visible_features()
+        QTimer.singleShot(0, self.integrate_deferred_features)
+    
+    def integrate_visible_features(self):
+        """Integrate the features shown as soon as the main window appears."""
         # Add language selector to status bar
         self.integrate_language_selector()
         
+        # Apply current language
+        self.apply_language_settings()
+    
+    def integrate_deferred_features(self):
+        """Integrate the features that are only reached through menus."""
         # Add performance monitoring
         self.setup_performance_monitoring()
         
         # Add settings menu items
         self.integrate_settings_menu()
         
-        # Apply current language
-        self.apply_language_settings()
-        
     def check_telemetry_consent(self):
         """Check if telemetry consent has been requested."""
         # Check if this is the first run or if consent hasn't been asked'
@@ -200,13 +270,15 @@ class FeatureIntegrator:
     
     def show_telemetry_consent_dialog(self):
         """Show the telemetry consent dialog."""
+        from src.ui.telemetry_consent_dialog import TelemetryConsentDialog
+        
         dialog = TelemetryConsentDialog(self.main_window)
         dialog.consent_given.connect(self.on_telemetry_consent)
         dialog.exec()
         
         # Mark as shown regardless of the decision
         self.settings["telemetry_consent_shown"] = True
-        save_settings(self.settings)
+        self._schedule_save()
     
     def on_telemetry_consent(self, accepted, privacy_settings):
         """"
@@ -229,10 +301,31 @@ class FeatureIntegrator:
             telemetry.record_feature_usage("telemetry_consent", {"accepted": True})
         
         # Save settings
-        save_settings(self.settings)
+        self._schedule_save()
+    
+    def _schedule_save(self):
+        """Save the settings once changes have settled."""
+        self._settings_dirty = True
+        self._save_timer.start()
+    
+    def _flush_settings(self):
+        """Hand pending settings changes to the background writer."""
+        if not self._settings_dirty:
+            return
+        
+        self._settings_dirty = False
+        self._save_timer.stop()
+        _settings_writer.submit(self.settings)
+    
+    def _on_about_to_quit(self):
+        """Write pending settings changes before the application exits."""
+        self._flush_settings()
+        _settings_writer.close()
     
     def integrate_language_selector(self):
         """Add language selector to the application."""
+        from src.ui.language_selector import LanguageSelector
+        
         # Create language selector
         self.language_selector = LanguageSelector(self.main_window)
         
@@ -256,7 +349,7 @@ class FeatureIntegrator:
         """"
         # Update settings
         self.settings["language"] = language_code
-        save_settings(self.settings)
+        self._schedule_save()
         
         # Apply language to UI
         self.apply_language_settings()
@@ -266,7 +359,7 @@ class FeatureIntegrator:
             telemetry.record_feature_usage("language_change", {"language": language_code})
         
         # Show message to user
-        QMessageBox.information()
+        _qt().QMessageBox.information(
             self.main_window,
             get_string("language.changed_title", "Language Changed"),
             get_string("language.changed_message", "Some UI elements will update immediately. Others may require a restart.")
@@ -315,18 +408,19 @@ class FeatureIntegrator:
         menu_bar = self.main_window.menuBar()
         if menu_bar:
             # Look for existing help menu
+            help_label = get_string("ui.help", "Help")
             help_menu = None
             for action in menu_bar.actions():
-                if action.text() == get_string("ui.help", "Help"):
+                if action.text() == help_label:
                     help_menu = action.menu()
                     break
             
             # Create help menu if it doesn't exist'
             if not help_menu:
-                help_menu = menu_bar.addMenu(get_string("ui.help", "Help"))
+                help_menu = menu_bar.addMenu(help_label)
             
             # Add performance action
-            performance_action = QAction()
+            performance_action = _qt().QAction(
                 get_string("ui.performance", "Performance Monitor"), 
                 self.main_window
             )
@@ -339,13 +433,16 @@ class FeatureIntegrator:
         """Show the performance monitoring dialog."""
         # Create dialog if it doesn't exist'
         if not self.performance_dialog:
-            self.performance_dialog = QDialog(self.main_window)
+            from src.ui.performance_monitor_widget import PerformanceMonitorWidget
+            
+            qt = _qt()
+            self.performance_dialog = qt.QDialog(self.main_window)
             self.performance_dialog.setWindowTitle(get_string("performance.title", "Performance Monitor"))
             self.performance_dialog.setMinimumWidth(800)
             self.performance_dialog.setMinimumHeight(600)
             
             # Create layout
-            layout = QVBoxLayout(self.performance_dialog)
+            layout = qt.QVBoxLayout(self.performance_dialog)
             
             # Add performance widget
             performance_widget = PerformanceMonitorWidget(self.performance_dialog)
@@ -368,27 +465,29 @@ class FeatureIntegrator:
         menu_bar = self.main_window.menuBar()
         if menu_bar:
             # Create settings action
-            settings_action = QAction()
+            settings_action = _qt().QAction(
                 get_string("ui.settings", "Settings"), 
                 self.main_window
             )
             settings_action.triggered.connect(self.show_settings_dialog)
             
             # Look for existing file menu
+            file_label = get_string("ui.file", "File")
             file_menu = None
             for action in menu_bar.actions():
-                if action.text() == get_string("ui.file", "File"):
+                if action.text() == file_label:
                     file_menu = action.menu()
                     break
             
             # Create file menu if it doesn't exist'
             if not file_menu:
-                file_menu = menu_bar.addMenu(get_string("ui.file", "File"))
+                file_menu = menu_bar.addMenu(file_label)
             
             # Add settings action (before exit if it exists)
+            exit_label = get_string("ui.exit", "Exit")
             exit_action = None
             for action in file_menu.actions():
-                if action.text() == get_string("ui.exit", "Exit"):
+                if action.text() == exit_label:
                     exit_action = action
                     break
             
@@ -402,6 +501,8 @@ class FeatureIntegrator:
     
     def show_settings_dialog(self):
         """Show the settings dialog."""
+        from src.ui.settings_dialog import SettingsDialog
+        
         dialog = SettingsDialog(self.main_window)
         dialog.settings_changed.connect(self.on_settings_changed)
         
@@ -42,7 +42,6 @@ except ImportError:
     from PyQt5.QtGui import QAction, QIcon, QDesktopServices
 
 from src.ui.styles import StyleManager
-from src.ui.dialogs import SettingsDialog, AboutDialog, ErrorDialog
 from src.ui.url_input_widget import UrlInputWidget
 from src.ui.batch_status_widget import BatchStatusWidget
 from src.ui.task_list_widget import TaskListWidget
@@ -232,8 +231,10 @@ class MainWindow(QMainWindow):
     def _handle_error_report(self, message, details):
         """Handle error reports from the application manager."""
         logger.error(f"Error: {message} - {details}")
-        error_dialog = ErrorDialog(message, details, self)
-        error_dialog.exec()
+        # Dialogs are imported on first use to keep them off the startup path
+        from src.ui.dialogs import ErrorDialog
+        
+        ErrorDialog.open_for(self, message, details)
     
     @pyqtSlot(object)
     def _handle_batch_status_change(self, status):
@@ -288,15 +289,15 @@ class MainWindow(QMainWindow):
     
     def _show_settings(self):
         """Show the settings dialog."""
-        dialog = SettingsDialog(self.app_manager.settings, self)
-        if dialog.exec():
-            new_settings = dialog.get_settings()
-            self.app_manager.save_settings(new_settings)
+        from src.ui.dialogs import SettingsDialog
+        
+        SettingsDialog.open_for(self, self.app_manager.settings, self.app_manager.save_settings)
     
     def _show_about(self):
         """Show the about dialog."""
-        dialog = AboutDialog(self)
-        dialog.exec()
+        from src.ui.dialogs import show_about
+        
+        show_about(self)
     
     def _show_help(self):
         """Show help documentation."""
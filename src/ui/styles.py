@@ -4,6 +4,7 @@ Provides consistent styling and theming across the application.
 """"
 
 import logging
+from functools import lru_cache
 
 # PyQt imports with fallbacks
 try:
@@ -251,7 +252,7 @@ class StyleManager:
             color: white;
         }}
         
-        QLineEdit, QTextEdit, QComboBox, QSpinBox {{
+        QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox {{
             background-color: {self.colors["bg_tertiary"]};
             color: {self.colors["text_primary"]};
             border: 1px solid {self.colors["border"]};
@@ -424,3 +425,14 @@ class StyleManager:
             }}
         """)"
         return button
+
+
+@lru_cache(maxsize=1)
+def get_style_manager() -> StyleManager:
+    """"
+    Get the style manager shared by the dialogs.
+    
+    Returns:
+        The process-wide StyleManager instance
+    """"
+    return StyleManager()
@@ -150,26 +150,101 @@ class CacheManager:
         if not self.enabled:
             return None
             
-        cache_key = f"audio:{video_id}"
+        audio_path = self._lookup_audio(video_id)
+        self._save_cache_index()
+        return audio_path
+    
+    def _lookup_entry(self, cache_key: str, load_json: bool) -> Optional[Any]:
+        """"
+        Look up a cache entry and record the hit or miss without saving the index.
+        
+        Args:
+            cache_key: Key of the cache entry
+            load_json: Whether to load the cached file as JSON instead of returning its path
+            
+        Returns:
+            Loaded data or file path on a hit, None on a miss
+        """"
         cache_entry = self.cache_index.get("entries", {}).get(cache_key)
         
         if cache_entry and self._is_entry_valid(cache_entry):
             # Check if file exists
             file_path = Path(cache_entry["file_path"])
             if file_path.exists():
-                # Update access time
-                cache_entry["last_accessed"] = datetime.now().isoformat()
-                self.cache_index["stats"]["hits"] += 1
-                self._save_cache_index()
-                logger.info(f"Cache hit for audio of video {video_id}")
-                return str(file_path)
+                try:
+                    if load_json:
+                        with open(file_path, 'r', encoding='utf-8') as f:
+                            value = json.load(f)
+                    else:
+                        value = str(file_path)
+                    
+                    # Update access time
+                    cache_entry["last_accessed"] = datetime.now().isoformat()
+                    self.cache_index["stats"]["hits"] += 1
+                    return value
+                except Exception as e:
+                    logger.error(f"Failed to load cached entry {cache_key}: {e}")
         
         # Cache miss
         self.cache_index["stats"]["misses"] += 1
-        self._save_cache_index()
-        logger.info(f"Cache miss for audio of video {video_id}")
         return None
     
+    def _lookup_audio(self, video_id: str) -> Optional[str]:
+        """Look up cached audio without saving the index."""
+        audio_path = self._lookup_entry(f"audio:{video_id}", load_json=False)
+        if audio_path:
+            logger.info(f"Cache hit for audio of video {video_id}")
+        else:
+            logger.info(f"Cache miss for audio of video {video_id}")
+        return audio_path
+    
+    def _lookup_transcription(self, video_id: str, model_name: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached transcription without saving the index."""
+        transcription = self._lookup_entry(f"transcription:{video_id}:{model_name}", load_json=True)
+        if transcription:
+            logger.info(f"Cache hit for transcription of video {video_id} with model {model_name}")
+        else:
+            logger.info(f"Cache miss for transcription of video {video_id} with model {model_name}")
+        return transcription
+    
+    def _lookup_translation(self, video_id: str, source_lang: str,
+                            target_lang: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached translation without saving the index."""
+        translation = self._lookup_entry(f"translation:{video_id}:{source_lang}:{target_lang}",
+                                         load_json=True)
+        if translation:
+            logger.info(f"Cache hit for translation of video {video_id} from {source_lang} to {target_lang}")
+        else:
+            logger.info(f"Cache miss for translation of video {video_id} from {source_lang} to {target_lang}")
+        return translation
+    
+    @try_except_decorator
+    def probe_all(self, video_id: str, model_name: str, source_lang: str,
+                  target_lang: str) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """"
+        Look up cached audio, transcription and translation for a video at once.
+        
+        Equivalent to calling get_cached_audio, get_cached_transcription and
+        get_cached_translation, but saves the cache index only once.
+        
+        Args:
+            video_id: YouTube video ID
+            model_name: Transcription model name
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Tuple of (audio path, transcription data, translation data), each None if not cached
+        """"
+        if not self.enabled:
+            return None, None, None
+            
+        audio_path = self._lookup_audio(video_id)
+        transcription = self._lookup_transcription(video_id, model_name)
+        translation = self._lookup_translation(video_id, source_lang, target_lang)
+        self._save_cache_index()
+        return audio_path, transcription, translation
+    
     @try_except_decorator
     def cache_audio(self, video_id: str, audio_file: Union[str, Path], )
                     metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -243,32 +318,9 @@ class CacheManager:
         if not self.enabled:
             return None
             
-        cache_key = f"transcription:{video_id}:{model_name}"
-        cache_entry = self.cache_index.get("entries", {}).get(cache_key)
-        
-        if cache_entry and self._is_entry_valid(cache_entry):
-            # Check if file exists
-            file_path = Path(cache_entry["file_path"])
-            if file_path.exists():
-                try:
-                    # Load transcription data
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        transcription = json.load(f)
-                    
-                    # Update access time
-                    cache_entry["last_accessed"] = datetime.now().isoformat()
-                    self.cache_index["stats"]["hits"] += 1
-                    self._save_cache_index()
-                    logger.info(f"Cache hit for transcription of video {video_id} with model {model_name}")
-                    return transcription
-                except Exception as e:
-                    logger.error(f"Failed to load cached transcription: {e}")
-        
-        # Cache miss
-        self.cache_index["stats"]["misses"] += 1
+        transcription = self._lookup_transcription(video_id, model_name)
         self._save_cache_index()
-        logger.info(f"Cache miss for transcription of video {video_id} with model {model_name}")
-        return None
+        return transcription
     
     @try_except_decorator
     def cache_transcription(self, video_id: str, model_name: str, )
@@ -339,32 +391,9 @@ class CacheManager:
         if not self.enabled:
             return None
             
-        cache_key = f"translation:{video_id}:{source_lang}:{target_lang}"
-        cache_entry = self.cache_index.get("entries", {}).get(cache_key)
-        
-        if cache_entry and self._is_entry_valid(cache_entry):
-            # Check if file exists
-            file_path = Path(cache_entry["file_path"])
-            if file_path.exists():
-                try:
-                    # Load translation data
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        translation = json.load(f)
-                    
-                    # Update access time
-                    cache_entry["last_accessed"] = datetime.now().isoformat()
-                    self.cache_index["stats"]["hits"] += 1
-                    self._save_cache_index()
-                    logger.info(f"Cache hit for translation of video {video_id} from {source_lang} to {target_lang}")
-                    return translation
-                except Exception as e:
-                    logger.error(f"Failed to load cached translation: {e}")
-        
-        # Cache miss
-        self.cache_index["stats"]["misses"] += 1
+        translation = self._lookup_translation(video_id, source_lang, target_lang)
         self._save_cache_index()
-        logger.info(f"Cache miss for translation of video {video_id} from {source_lang} to {target_lang}")
-        return None
+        return translation
     
     @try_except_decorator
     def cache_translation(self, video_id: str, source_lang: str, target_lang: str,)
@@ -0,0 +1,111 @@
+"""
+Persistent translation cache for YouTube Translator Pro.
+Stores translated texts in SQLite so repeated segments survive restarts.
+"""
+
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from src.config import CACHE_DIR
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """
+    SQLite store of translated texts.
+    Entries are keyed by a hash of engine, target language and text and expire after a TTL.
+    """
+    
+    def __init__(self, db_path: Union[str, Path] = CACHE_DIR / "translations.db", ttl_days: float = 30):
+        """
+        Open the translation cache, creating the database if needed.
+        
+        Args:
+            db_path: Path of the SQLite database file
+            ttl_days: Days after which cached translations expire
+        """
+        self.db_path = str(db_path)
+        self.ttl_seconds = int(ttl_days * 24 * 60 * 60)
+        self._lock = threading.Lock()
+        
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "hash TEXT PRIMARY KEY, engine TEXT, lang TEXT, translated TEXT, ts INTEGER)"
+            )
+            # Drop expired entries once per start instead of on every lookup
+            self._connection.execute("DELETE FROM translations WHERE ts < ?", (self._expiry_time(),))
+        
+        logger.info(f"Translation cache opened at {self.db_path}")
+    
+    @staticmethod
+    def _key(engine: str, lang: str, text: str) -> str:
+        """Hash engine, target language and text into a cache key."""
+        return hashlib.sha256(f"{engine}|{lang}|{text}".encode('utf-8')).hexdigest()
+    
+    def _expiry_time(self) -> int:
+        """Oldest timestamp that has not expired."""
+        return int(time.time()) - self.ttl_seconds
+    
+    def get_many(self, engine: str, lang: str, texts: List[str]) -> Dict[str, str]:
+        """
+        Look up cached translations.
+        
+        Args:
+            engine: Name of the translation engine
+            lang: Target language code
+            texts: Texts to look up
+        
+        Returns:
+            Dictionary mapping each cached text to its translation
+        """
+        keys = {self._key(engine, lang, text): text for text in texts}
+        if not keys:
+            return {}
+        
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT hash, translated FROM translations WHERE ts >= ? AND hash IN ({placeholders})",
+                (self._expiry_time(), *keys)
+            ).fetchall()
+        return {keys[key]: translated for key, translated in rows}
+    
+    def put_many(self, engine: str, lang: str, translations: List[Tuple[str, str]]):
+        """
+        Store translations in one transaction.
+        
+        Args:
+            engine: Name of the translation engine
+            lang: Target language code
+            translations: (text, translated text) pairs
+        """
+        now = int(time.time())
+        rows = [
+            (self._key(engine, lang, text), engine, lang, translated, now)
+            for text, translated in translations
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO translations (hash, engine, lang, translated, ts) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+    
+    def clear(self):
+        """Remove all cached translations."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM translations")
+        logger.info("Translation cache cleared")
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -250,3 +250,30 @@ class TestCacheManager:
         
         # Check that None was returned
         assert result is None
+    
+    def test_probe_all(self, temp_cache_dir, tmp_path):
+        """Test probing all cache stages with a single index save."""
+        # Create a test audio file
+        test_audio = tmp_path / "test_audio.wav"
+        test_audio.write_bytes(b"test audio data")
+        
+        # Initialize cache manager
+        cache_manager = CacheManager(cache_dir=temp_cache_dir, enabled=True)
+        
+        # Cache audio and transcription, but no translation
+        video_id = "test_video_id"
+        cached_path = cache_manager.cache_audio(video_id=video_id, audio_file=str(test_audio))
+        cache_manager.cache_transcription(video_id, "en", {"text": "Hello"})
+        
+        with patch.object(cache_manager, "_save_cache_index") as mock_save:
+            audio_path, transcription, translation = cache_manager.probe_all(video_id, "en", "en", "es")
+        
+        # Check the lookups and that the index was saved once
+        assert audio_path == cached_path
+        assert transcription == {"text": "Hello"}
+        assert translation is None
+        mock_save.assert_called_once()
+        
+        # Two hits and one miss should be recorded
+        assert cache_manager.cache_index["stats"]["hits"] == 2
+        assert cache_manager.cache_index["stats"]["misses"] == 1
@@ -0,0 +1,58 @@
+"""
+Tests for the TranslationCache component.
+"""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.translation_cache import TranslationCache
+
+
+class TestTranslationCache:
+    """Tests for the TranslationCache class."""
+    
+    def test_put_and_get(self, temp_cache_dir):
+        """Test that stored translations are returned by engine and language."""
+        cache = TranslationCache(db_path=Path(temp_cache_dir) / "translations.db")
+        cache.put_many("DeepLTranslator", "es", [("Hello", "Hola"), ("[Music]", "[Música]")])
+        
+        assert cache.get_many("DeepLTranslator", "es", ["Hello", "Bye", "[Music]"]) == {
+            "Hello": "Hola",
+            "[Music]": "[Música]"
+        }
+        
+        # Other engines and languages are cached separately
+        assert cache.get_many("GoogleTranslator", "es", ["Hello"]) == {}
+        assert cache.get_many("DeepLTranslator", "fr", ["Hello"]) == {}
+        cache.close()
+    
+    def test_persists_across_instances(self, temp_cache_dir):
+        """Test that translations survive reopening the database."""
+        db_path = Path(temp_cache_dir) / "translations.db"
+        cache = TranslationCache(db_path=db_path)
+        cache.put_many("GoogleTranslator", "de", [("Hello", "Hallo")])
+        cache.close()
+        
+        cache = TranslationCache(db_path=db_path)
+        assert cache.get_many("GoogleTranslator", "de", ["Hello"]) == {"Hello": "Hallo"}
+        cache.close()
+    
+    def test_expired_entries_are_ignored(self, temp_cache_dir):
+        """Test that translations older than the TTL are not returned."""
+        cache = TranslationCache(db_path=Path(temp_cache_dir) / "translations.db", ttl_days=1)
+        
+        with patch("src.utils.translation_cache.time.time", return_value=time.time() - 2 * 24 * 60 * 60):
+            cache.put_many("GoogleTranslator", "de", [("Hello", "Hallo")])
+        
+        assert cache.get_many("GoogleTranslator", "de", ["Hello"]) == {}
+        cache.close()
+    
+    def test_clear(self, temp_cache_dir):
+        """Test clearing the cache."""
+        cache = TranslationCache(db_path=Path(temp_cache_dir) / "translations.db")
+        cache.put_many("GoogleTranslator", "de", [("Hello", "Hallo")])
+        cache.clear()
+        
+        assert cache.get_many("GoogleTranslator", "de", ["Hello"]) == {}
+        cache.close()
@@ -0,0 +1,59 @@
+"""
+Tests for the packed batch translation in BaseTranslator.
+"""
+
+from src.services.translation_service import BaseTranslator, SEGMENT_DELIMITER
+
+
+class StubTranslator(BaseTranslator):
+    """Translator that upper-cases text and records each translate_text call."""
+    
+    pack_size = 3
+    persistent_cache = False
+    
+    def __init__(self, drop_delimiters=False):
+        self.calls = []
+        self.drop_delimiters = drop_delimiters
+    
+    def translate_text(self, text, target_language, stop_event=None):
+        self.calls.append(text)
+        if self.drop_delimiters and SEGMENT_DELIMITER in text:
+            # Mimic an engine that merges the packed segments
+            text = text.replace(SEGMENT_DELIMITER, " ")
+        return text.upper(), None
+
+
+class TestTranslatePack:
+    """Tests for BaseTranslator.translate_batch and _translate_pack."""
+    
+    def test_pack_is_split_into_texts(self):
+        """Test that a packed translation is split back into one result per text."""
+        translator = StubTranslator()
+        
+        translations, error = translator.translate_batch(["one", "two", "three", "four"], "de")
+        
+        assert translations == ["ONE", "TWO", "THREE", "FOUR"]
+        assert error is None
+        # Three texts share one call, the fourth is sent on its own
+        assert translator.calls == [SEGMENT_DELIMITER.join(["one", "two", "three"]), "four"]
+    
+    def test_part_count_mismatch_translates_each_text(self):
+        """Test that a pack with the wrong number of parts falls back to one call per text."""
+        translator = StubTranslator(drop_delimiters=True)
+        
+        translations, error = translator.translate_batch(["one", "two"], "de")
+        
+        assert translations == ["ONE", "TWO"]
+        assert error is None
+        assert translator.calls == [SEGMENT_DELIMITER.join(["one", "two"]), "one", "two"]
+    
+    def test_text_containing_delimiter_is_not_packed(self):
+        """Test that texts containing the segment marker are translated one by one."""
+        translator = StubTranslator()
+        texts = ["one", "a <<<SEG>>> b", "three"]
+        
+        translations, error = translator.translate_batch(texts, "de")
+        
+        assert translations == ["ONE", "A <<<SEG>>> B", "THREE"]
+        assert error is None
+        assert translator.calls == texts